@@ -0,0 +1,83 @@
+"""Bounded in-memory caches with optional JSON persistence.
+
+Several converters keep a dict of results that is capped at a maximum size
+and can be written to disk between runs. Entries are stored as JSON lists of
+``[*key, value]`` rather than pickled, so a cache file cannot execute code
+when loaded.
+"""
+
+import json
+import os
+import tempfile
+import warnings
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+
+
+def cache_put(cache: dict[Any, Any], key: Hashable, value: Any, max_size: int) -> None:
+    """Add an entry to a bounded cache, evicting the oldest one if full.
+
+    Args:
+        cache: Cache to update.
+        key: Entry key.
+        value: Entry value.
+        max_size: Maximum number of entries.
+    """
+    if len(cache) >= max_size:
+        # Evict the oldest entry
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def load_json_cache(
+    path: Path,
+    cache: dict[tuple[Any, ...], Any],
+    key_size: int,
+    max_size: int,
+    name: str,
+) -> None:
+    """Fill a cache with entries written by save_json_cache().
+
+    Only the most recently saved ``max_size`` entries are loaded. An
+    unreadable file is ignored with a warning and leaves the cache empty.
+
+    Args:
+        path: File to read.
+        cache: Cache to fill.
+        key_size: Number of fields in each key tuple.
+        max_size: Maximum number of entries to load.
+        name: Description of the cache used in the warning.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)
+        for *key, value in entries[-max_size:]:
+            if len(key) != key_size:
+                raise ValueError(f"expected {key_size + 1} fields, got {key}")
+            cache[tuple(key)] = value
+    except (OSError, ValueError, TypeError) as e:
+        warnings.warn(f"Could not load {name} from {path}: {e}", stacklevel=3)
+        cache.clear()
+
+
+def save_json_cache(path: Path, cache: dict[tuple[Any, ...], Any]) -> None:
+    """Write a cache to a JSON file.
+
+    The file is replaced atomically, so a concurrent reader never sees a
+    partially written cache.
+
+    Args:
+        path: Target file. Missing parent directories are created.
+        cache: Cache to write.
+    """
+    entries = [[*key, value] for key, value in cache.items()]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
@@ -16,6 +16,7 @@ import pathlib
 import shutil
 import sys
 import tempfile
+import threading
 import weakref
 from pathlib import Path
 from typing import Any
@@ -90,6 +91,10 @@ class EspeakLibrary:
     own copy of the library to support multiple independent instances.
 
     The library uses espeak-ng's synchronous mode for phonemization.
+
+    espeak-ng keeps the selected voice in global state. Callers sharing one
+    instance hold ``lock`` while selecting a voice and converting text, and
+    check ``voice_name`` to see which voice is currently selected.
     """
 
     def __init__(
@@ -109,6 +114,8 @@ class EspeakLibrary:
         self._lib: ctypes.CDLL | None = None
         self._temp_dir: str | None = None
         self._original_path: Path | None = None
+        self.lock = threading.Lock()
+        self.voice_name: str | None = None
 
         # Convert data_path to bytes for C API
         data_bytes: bytes | None = None
@@ -142,6 +149,7 @@ class EspeakLibrary:
         # espeak_Initialize(output, buflength, path, options)
         # output=AUDIO_OUTPUT_SYNCHRONOUS (0x02), buflength=0, options=0
         try:
+            self._declare_functions(self._lib)
             result = self._lib.espeak_Initialize(
                 AUDIO_OUTPUT_SYNCHRONOUS, 0, data_bytes, 0
             )
@@ -156,6 +164,51 @@ class EspeakLibrary:
         if sys.platform != "win32":
             weakref.finalize(self, self._cleanup, self._lib, self._temp_dir)
 
+    @staticmethod
+    def _declare_functions(lib: ctypes.CDLL) -> None:
+        """Declare the C signatures of the API functions once after loading.
+
+        Args:
+            lib: The loaded library.
+
+        Raises:
+            AttributeError: If the library lacks one of the functions.
+        """
+        # int espeak_Initialize(espeak_AUDIO_OUTPUT output, int buflength,
+        #                       const char *path, int options)
+        lib.espeak_Initialize.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_int,
+        ]
+        lib.espeak_Initialize.restype = ctypes.c_int
+
+        # const char *espeak_Info(const char **path_data)
+        lib.espeak_Info.argtypes = [ctypes.POINTER(ctypes.c_char_p)]
+        lib.espeak_Info.restype = ctypes.c_char_p
+
+        # const espeak_VOICE **espeak_ListVoices(espeak_VOICE *voice_spec)
+        lib.espeak_ListVoices.argtypes = [ctypes.POINTER(VoiceStruct)]
+        lib.espeak_ListVoices.restype = ctypes.POINTER(ctypes.POINTER(VoiceStruct))
+
+        # espeak_ERROR espeak_SetVoiceByName(const char *name)
+        lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+        lib.espeak_SetVoiceByName.restype = ctypes.c_int
+
+        # espeak_VOICE *espeak_GetCurrentVoice(void)
+        lib.espeak_GetCurrentVoice.argtypes = []
+        lib.espeak_GetCurrentVoice.restype = ctypes.POINTER(VoiceStruct)
+
+        # const char *espeak_TextToPhonemes(const void **textptr,
+        #                                   int textmode, int phonememode)
+        lib.espeak_TextToPhonemes.argtypes = [
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.c_int,
+            ctypes.c_int,
+        ]
+        lib.espeak_TextToPhonemes.restype = ctypes.c_char_p
+
     def _cleanup_windows(self) -> None:
         """Cleanup for Windows (atexit handler)."""
         self._cleanup(self._lib, self._temp_dir)
@@ -215,12 +268,8 @@ class EspeakLibrary:
         if self._lib is None:
             raise RuntimeError("Library not loaded")
 
-        # const char *espeak_Info(const char **path_data)
-        func = self._lib.espeak_Info
-        func.restype = ctypes.c_char_p
-
         path_ptr = ctypes.c_char_p()
-        version = func(ctypes.byref(path_ptr))
+        version = self._lib.espeak_Info(ctypes.byref(path_ptr))
 
         version_str = version.decode("utf-8") if version else ""
         path_str = path_ptr.value.decode("utf-8") if path_ptr.value else ""
@@ -242,13 +291,8 @@ class EspeakLibrary:
         if self._lib is None:
             raise RuntimeError("Library not loaded")
 
-        # const espeak_VOICE **espeak_ListVoices(espeak_VOICE *voice_spec)
-        func = self._lib.espeak_ListVoices
-        func.argtypes = [ctypes.POINTER(VoiceStruct)]
-        func.restype = ctypes.POINTER(ctypes.POINTER(VoiceStruct))
-
         filter_ptr = ctypes.pointer(voice_filter) if voice_filter else None
-        return func(filter_ptr)
+        return self._lib.espeak_ListVoices(filter_ptr)
 
     def set_voice_by_name(self, name: str) -> int:
         """Set the voice by name/identifier.
@@ -265,12 +309,10 @@ class EspeakLibrary:
         if self._lib is None:
             raise RuntimeError("Library not loaded")
 
-        # espeak_ERROR espeak_SetVoiceByName(const char *name)
-        func = self._lib.espeak_SetVoiceByName
-        func.argtypes = [ctypes.c_char_p]
-        func.restype = ctypes.c_int
-
-        return func(name.encode("utf-8"))
+        result = self._lib.espeak_SetVoiceByName(name.encode("utf-8"))
+        if result == 0:
+            self.voice_name = name
+        return result
 
     def get_current_voice(self) -> VoiceStruct:
         """Get the currently selected voice.
@@ -284,11 +326,7 @@ class EspeakLibrary:
         if self._lib is None:
             raise RuntimeError("Library not loaded")
 
-        # espeak_VOICE *espeak_GetCurrentVoice(void)
-        func = self._lib.espeak_GetCurrentVoice
-        func.restype = ctypes.POINTER(VoiceStruct)
-
-        return func().contents
+        return self._lib.espeak_GetCurrentVoice().contents
 
     def text_to_phonemes(
         self,
@@ -314,15 +352,7 @@ class EspeakLibrary:
         if self._lib is None:
             raise RuntimeError("Library not loaded")
 
-        # const char *espeak_TextToPhonemes(const void **textptr,
-        #                                   int textmode, int phonememode)
         func = self._lib.espeak_TextToPhonemes
-        func.restype = ctypes.c_char_p
-        func.argtypes = [
-            ctypes.POINTER(ctypes.c_char_p),
-            ctypes.c_int,
-            ctypes.c_int,
-        ]
 
         # Build phoneme_mode flags
         # bit 1: 1 = IPA output
@@ -337,17 +367,18 @@ class EspeakLibrary:
         elif separator:
             mode |= ord(separator[0]) << 8
 
-        # Create pointer to text
-        text_bytes = text.encode("utf-8")
-        text_ptr = ctypes.pointer(ctypes.c_char_p(text_bytes))
+        # espeak advances this buffer past each converted clause and sets it
+        # to NULL at the end of the text
+        text_buf = ctypes.c_char_p(text.encode("utf-8"))
+        text_ref = ctypes.byref(text_buf)
 
         # Text mode: 1 = UTF-8 input
         text_mode = CHARS_UTF8
 
         # Collect all phoneme chunks
         result_parts = []
-        while text_ptr.contents.value is not None:
-            phonemes = func(text_ptr, text_mode, mode)
+        while text_buf.value is not None:
+            phonemes = func(text_ref, text_mode, mode)
             if phonemes:
                 result_parts.append(phonemes.decode("utf-8"))
 
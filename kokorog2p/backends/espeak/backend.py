@@ -7,6 +7,12 @@ Copyright 2024 kokorog2p contributors
 Licensed under the Apache License, Version 2.0
 """
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Final
+
+from kokorog2p._cache import cache_put, load_json_cache, save_json_cache
 from kokorog2p.backends.espeak.wrapper import Phonemizer
 from kokorog2p.phonemes import from_espeak
 
@@ -24,11 +30,15 @@ class EspeakBackend:
         'hˈɛlO wˈɜɹld'
     """
 
+    # Maximum number of cached phonemize() results
+    _CACHE_SIZE: Final[int] = 4096
+
     def __init__(
         self,
         language: str = "en-us",
         with_stress: bool = True,
         tie: str = "^",
+        cache_path: str | Path | None = None,
     ) -> None:
         """Initialize the espeak backend.
 
@@ -36,11 +46,25 @@ class EspeakBackend:
             language: Language code (e.g., "en-us", "en-gb", "fr-fr").
             with_stress: Whether to include stress markers in output.
             tie: Tie character mode. "^" uses tie character for affricates.
+            cache_path: Optional JSON file used to persist the phonemize()
+                cache between runs. It is loaded here if it exists and
+                written by save_cache().
         """
         self.language = language
         self.with_stress = with_stress
         self.tie = tie
         self._phonemizer: Phonemizer | None = None
+        # (text, language, tie, convert_to_kokoro) -> phonemes
+        self._cache: dict[tuple[str, str, str, bool], str] = {}
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        if self.cache_path is not None and self.cache_path.exists():
+            load_json_cache(
+                self.cache_path,
+                self._cache,
+                key_size=4,
+                max_size=self._CACHE_SIZE,
+                name="espeak cache",
+            )
 
     @property
     def wrapper(self) -> Phonemizer:
@@ -70,29 +94,74 @@ class EspeakBackend:
         Returns:
             Phoneme string.
         """
-        # Use tie character for better handling of affricates (dʒ, tʃ)
-        use_tie = self.tie == "^"
-        raw_phonemes = self.wrapper.phonemize(text, use_tie=use_tie)
-
-        if convert_to_kokoro:
-            return from_espeak(raw_phonemes, british=self.is_british)
-        return raw_phonemes
+        key = (text, self.language, self.tie, convert_to_kokoro)
+        phonemes = self._cache.get(key)
+        if phonemes is None:
+            # Use tie character for better handling of affricates (dʒ, tʃ)
+            use_tie = self.tie == "^"
+            phonemes = self.wrapper.phonemize(text, use_tie=use_tie)
+            if convert_to_kokoro:
+                phonemes = from_espeak(phonemes, british=self.is_british)
+            cache_put(self._cache, key, phonemes, self._CACHE_SIZE)
+        return phonemes
 
     def phonemize_list(
         self,
         texts: list[str],
         convert_to_kokoro: bool = True,
+        n_jobs: int = 1,
     ) -> list[str]:
         """Convert multiple texts to phonemes.
 
         Args:
             texts: List of texts to convert.
             convert_to_kokoro: If True, convert to Kokoro format.
+            n_jobs: Number of worker processes. Only texts missing from the
+                cache are sent to them. Each worker starts a fresh
+                interpreter and loads its own espeak library, so this only
+                pays off for long lists.
 
         Returns:
             List of phoneme strings.
         """
-        return [self.phonemize(text, convert_to_kokoro) for text in texts]
+        if n_jobs <= 1:
+            return [self.phonemize(text, convert_to_kokoro) for text in texts]
+
+        keys = [(text, self.language, self.tie, convert_to_kokoro) for text in texts]
+        found = {key: self._cache[key] for key in keys if key in self._cache}
+        misses = list(dict.fromkeys(key for key in keys if key not in found))
+        if len(misses) < 2:
+            return [self.phonemize(text, convert_to_kokoro) for text in texts]
+
+        # One chunk per worker keeps inter-process traffic low
+        size = -(-len(misses) // n_jobs)
+        chunks = [
+            [key[0] for key in misses[i : i + size]]
+            for i in range(0, len(misses), size)
+        ]
+        # Forked workers would inherit the loaded library and its lock, so
+        # start them fresh
+        with ProcessPoolExecutor(
+            max_workers=len(chunks),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                self.language,
+                self.with_stress,
+                self.tie,
+                Phonemizer._custom_library,
+                Phonemizer._custom_data,
+            ),
+        ) as executor:
+            results = executor.map(
+                _phonemize_chunk, chunks, [convert_to_kokoro] * len(chunks)
+            )
+            phonemized = [phonemes for chunk in results for phonemes in chunk]
+
+        for key, phonemes in zip(misses, phonemized, strict=True):
+            cache_put(self._cache, key, phonemes, self._CACHE_SIZE)
+            found[key] = phonemes
+        return [found[key] for key in keys]
 
     def word_phonemes(
         self,
@@ -112,6 +181,32 @@ class EspeakBackend:
         # Clean up: remove separators and trailing whitespace
         return result.strip().replace("_", "")
 
+    def clear_cache(self) -> None:
+        """Clear the cache of phonemize() results."""
+        self._cache.clear()
+
+    def save_cache(self, path: str | Path | None = None) -> None:
+        """Write the phonemize() cache to disk.
+
+        Args:
+            path: Target file. Defaults to the cache_path given at init.
+
+        Raises:
+            ValueError: If no path is given and no cache_path was set.
+        """
+        target = Path(path) if path is not None else self.cache_path
+        if target is None:
+            raise ValueError("No cache path given")
+        save_json_cache(target, self._cache)
+
+    def get_cache_size(self) -> int:
+        """Get the number of cached phonemize() results.
+
+        Returns:
+            Number of entries in the cache.
+        """
+        return len(self._cache)
+
     @property
     def version(self) -> str:
         """Get espeak version as string (e.g., "1.51.1")."""
@@ -119,3 +214,28 @@ class EspeakBackend:
 
     def __repr__(self) -> str:
         return f"EspeakBackend(language={self.language!r})"
+
+
+# Backend of a phonemize_list() worker process
+_worker_backend: EspeakBackend | None = None
+
+
+def _init_worker(
+    language: str,
+    with_stress: bool,
+    tie: str,
+    library_path: str | None,
+    data_path: str | None,
+) -> None:
+    """Create the backend of a phonemize_list() worker process."""
+    global _worker_backend
+    Phonemizer.set_library_path(library_path)
+    Phonemizer.set_data_path(data_path)
+    _worker_backend = EspeakBackend(language, with_stress, tie)
+
+
+def _phonemize_chunk(texts: list[str], convert_to_kokoro: bool) -> list[str]:
+    """Convert a chunk of texts to phonemes in a worker process."""
+    if _worker_backend is None:
+        raise RuntimeError("phonemize_list() worker was not initialized")
+    return [_worker_backend.phonemize(text, convert_to_kokoro) for text in texts]
@@ -11,7 +11,7 @@ import ctypes
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Voice:
     """Represents an espeak-ng voice.
 
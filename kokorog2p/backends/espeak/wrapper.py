@@ -11,8 +11,10 @@ Licensed under the Apache License, Version 2.0
 import ctypes.util
 import os
 import pathlib
+import threading
+import weakref
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from kokorog2p.backends.espeak.api import PHONEMES_IPA, EspeakLibrary
 from kokorog2p.backends.espeak.voice import (
@@ -119,22 +121,74 @@ class Phonemizer:
     _custom_library: str | None = None
     _custom_data: str | None = None
 
+    # Voice lists by (library path, data path, filter). Every copy of a
+    # library reads the same installed voices, so instances share them.
+    _voices_cache: ClassVar[
+        dict[tuple[str, str | Path | None, str | None], tuple[Voice, ...]]
+    ] = {}
+
+    # Language code to voice identifier maps, built from the voice lists
+    _voice_index_cache: ClassVar[
+        dict[tuple[str, str | Path | None, str | None], dict[str, str]]
+    ] = {}
+
+    # Loaded libraries by (library path, data path), shared by all instances
+    # using them and released with the last one
+    _libraries: ClassVar[
+        weakref.WeakValueDictionary[tuple[str, str | Path | None], EspeakLibrary]
+    ] = weakref.WeakValueDictionary()
+    _libraries_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # Parsed espeak_Info() results (version, data path) by (library path,
+    # data path)
+    _info_cache: ClassVar[
+        dict[tuple[str, str | Path | None], tuple[tuple[int, ...], Path | None]]
+    ] = {}
+
     def __init__(self) -> None:
         """Initialize the phonemizer.
 
+        The library is loaded on first use. The version and voice lists are
+        shared between instances, so reading those may not load it at all.
+
         Raises:
-            RuntimeError: If espeak-ng library cannot be loaded.
+            RuntimeError: If espeak-ng library cannot be found.
         """
         self._version: tuple[int, ...] | None = None
         self._data_path: Path | None = None
         self._current_voice: Voice | None = None
+        self._voice_identifier: str | None = None
 
         # Find library and data paths
-        lib_path = self._custom_library or find_espeak_library()
-        data_path = self._custom_data or find_espeak_data()
+        self._library = self._custom_library or find_espeak_library()
+        self._data = self._custom_data or find_espeak_data()
+        self._espeak: EspeakLibrary | None = None
 
-        # Initialize low-level API
-        self._api = EspeakLibrary(lib_path, data_path)
+    @property
+    def _api(self) -> EspeakLibrary:
+        """Get the low-level API, loading the library on first use."""
+        if self._espeak is None:
+            key = (self._library, self._data)
+            with self._libraries_lock:
+                api = self._libraries.get(key)
+                if api is None:
+                    api = EspeakLibrary(self._library, self._data)
+                    self._libraries[key] = api
+            self._espeak = api
+        return self._espeak
+
+    def _get_info(self) -> tuple[tuple[int, ...], Path | None]:
+        """Get the parsed espeak version and data path, shared per library."""
+        key = (self._library, self._data)
+        info = self._info_cache.get(key)
+        if info is None:
+            version_str, data_str = self._api.get_info()
+            # Parse version string (e.g., "1.51.1" or "1.51.1-dev")
+            version_clean = version_str.strip().split()[0].replace("-dev", "")
+            version = tuple(int(x) for x in version_clean.split("."))
+            info = (version, pathlib.Path(data_str) if data_str else None)
+            self._info_cache[key] = info
+        return info
 
     @classmethod
     def set_library_path(cls, path: str | None) -> None:
@@ -155,32 +209,27 @@ class Phonemizer:
         cls._custom_data = path
 
     def __getstate__(self) -> dict[str, Any]:
-        """Support pickling for multiprocessing."""
-        return {
-            "version": self._version,
-            "data_path": self._data_path,
-            "voice": self._current_voice,
-        }
+        """Support pickling for multiprocessing.
+
+        Only the selected language is stored. The version and data path are
+        read again from the library, which is shared within a process.
+        """
+        voice = self._current_voice
+        return {"language": voice.language if voice else None}
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         """Restore from pickle."""
         self.__init__()
-        self._version = state["version"]
-        self._data_path = state["data_path"]
-        self._current_voice = state["voice"]
-        if self._current_voice:
-            self.set_voice(self._current_voice.language)
+        if state["language"]:
+            self.set_voice(state["language"])
 
     @property
     def version(self) -> tuple[int, ...]:
         """Get espeak version as tuple of integers."""
         if self._version is None:
-            version_str, data_str = self._api.get_info()
-            # Parse version string (e.g., "1.51.1" or "1.51.1-dev")
-            version_clean = version_str.strip().split()[0].replace("-dev", "")
-            self._version = tuple(int(x) for x in version_clean.split("."))
-            if data_str:
-                self._data_path = pathlib.Path(data_str)
+            self._version, data_path = self._get_info()
+            if data_path is not None:
+                self._data_path = data_path
         return self._version
 
     @property
@@ -192,9 +241,7 @@ class Phonemizer:
     def data_path(self) -> Path | None:
         """Get path to espeak data directory."""
         if self._data_path is None:
-            _, data_str = self._api.get_info()
-            if data_str:
-                self._data_path = pathlib.Path(data_str)
+            self._data_path = self._get_info()[1]
         return self._data_path
 
     @property
@@ -211,24 +258,53 @@ class Phonemizer:
         Returns:
             List of available Voice objects.
         """
+        key = (self._library, self._data, filter_name or None)
+        cached = self._voices_cache.get(key)
+        if cached is None:
+            cached = tuple(self._list_voices(filter_name))
+            self._voices_cache[key] = cached
+        return list(cached)
+
+    def _list_voices(self, filter_name: str | None) -> list[Voice]:
+        """Enumerate the voices known to the library."""
         # Create filter if specified
         voice_filter = None
         if filter_name:
             filter_voice = Voice(language=filter_name)
             voice_filter = voice_to_struct(filter_voice)
 
-        # Get voices from library
-        voice_ptrs = self._api.list_voices(voice_filter)
-
+        api = self._api
         voices: list[Voice] = []
-        idx = 0
-        while voice_ptrs[idx]:
-            struct = voice_ptrs[idx].contents
-            voices.append(struct_to_voice(struct))
-            idx += 1
+        with api.lock:
+            # Get voices from library
+            voice_ptrs = api.list_voices(voice_filter)
+
+            idx = 0
+            while voice_ptrs[idx]:
+                struct = voice_ptrs[idx].contents
+                voices.append(struct_to_voice(struct))
+                idx += 1
 
         return voices
 
+    def _voice_index(self, mbrola: bool) -> dict[str, str]:
+        """Map language codes to voice identifiers, shared per library."""
+        key = (self._library, self._data, "mbrola" if mbrola else None)
+        index = self._voice_index_cache.get(key)
+        if index is None:
+            index = {}
+            if mbrola:
+                # Mbrola voices use identifier format "mb/{voice}"
+                for v in self.list_voices("mbrola"):
+                    index[v.identifier[3:]] = v.identifier
+            else:
+                # Regular espeak voices - the first voice for a language wins
+                for v in self.list_voices():
+                    if v.language and v.language not in index:
+                        index[v.language] = v.identifier
+            self._voice_index_cache[key] = index
+        return index
+
     def set_voice(self, language: str) -> None:
         """Set the voice for phonemization.
 
@@ -241,32 +317,21 @@ class Phonemizer:
         if not language:
             raise RuntimeError('Invalid voice code ""')
 
-        # Check if this is an mbrola voice
-        if "mb" in language:
-            # Mbrola voices use identifier format "mb/{voice}"
-            available = {
-                v.identifier[3:]: v.identifier for v in self.list_voices("mbrola")
-            }
-        else:
-            # Regular espeak voices - map language to identifier
-            available: dict[str, str] = {}
-            for v in self.list_voices():
-                if v.language and v.language not in available:
-                    available[v.language] = v.identifier
-
         # Find voice identifier
-        if language not in available:
+        identifier = self._voice_index(mbrola="mb" in language).get(language)
+        if identifier is None:
             raise RuntimeError(f'Invalid voice code "{language}"')
 
-        identifier = available[language]
-
         # Set the voice
-        if self._api.set_voice_by_name(identifier) != 0:
-            raise RuntimeError(f'Failed to set voice "{language}"')
+        api = self._api
+        with api.lock:
+            if api.set_voice_by_name(identifier) != 0:
+                raise RuntimeError(f'Failed to set voice "{language}"')
 
-        # Update current voice
-        voice_struct = self._api.get_current_voice()
-        self._current_voice = struct_to_voice(voice_struct)
+            # Update current voice
+            voice_struct = api.get_current_voice()
+            self._current_voice = struct_to_voice(voice_struct)
+        self._voice_identifier = identifier
 
     def phonemize(self, text: str, use_tie: bool = False) -> str:
         """Convert text to phonemes.
@@ -288,12 +353,22 @@ class Phonemizer:
         if use_tie and self.version < (1, 49):
             raise RuntimeError("Tie option requires espeak >= 1.49")
 
-        return self._api.text_to_phonemes(
-            text,
-            phoneme_mode=PHONEMES_IPA,
-            separator="_" if not use_tie else None,
-            use_tie=use_tie,
-        )
+        api = self._api
+        with api.lock:
+            # Another instance sharing the library may have switched voices
+            if (
+                self._voice_identifier is not None
+                and api.voice_name != self._voice_identifier
+                and api.set_voice_by_name(self._voice_identifier) != 0
+            ):
+                raise RuntimeError(f'Failed to set voice "{self._voice_identifier}"')
+
+            return api.text_to_phonemes(
+                text,
+                phoneme_mode=PHONEMES_IPA,
+                separator="_" if not use_tie else None,
+                use_tie=use_tie,
+            )
 
 
 # Backwards compatibility aliases
@@ -19,6 +19,9 @@ CURRENCIES = {
     "€": ("euro", "cent"),
 }
 
+# Separators between the words produced by num2words ("twenty-one", "one hundred")
+_NON_WORD_RE = re.compile(r"[^a-z]+")
+
 
 def is_digit(text: str) -> bool:
     """Check if text consists only of digits."""
@@ -33,6 +36,17 @@ def is_currency_amount(word: str) -> bool:
     return all(is_digit(p) for p in parts if p)
 
 
+def _split_words(text: str) -> list[str]:
+    """Split num2words output into its lowercase words.
+
+    Single words such as "one" or "seventeen" are the common case and skip
+    the regex split entirely.
+    """
+    if text.isascii() and text.isalpha() and text.islower():
+        return [text]
+    return _NON_WORD_RE.split(text)
+
+
 class NumberConverter:
     """Convert numbers to their word representations.
 
@@ -84,10 +98,10 @@ class NumberConverter:
     ) -> None:
         """Extend result with words for a number."""
         if escape:
-            splits = re.split(r"[^a-z]+", num)
+            splits = _split_words(num)
         else:
             try:
-                splits = re.split(r"[^a-z]+", self.num2words(int(num)))
+                splits = _split_words(self.num2words(int(num)))
             except (ValueError, OverflowError):
                 splits = [num]
 
@@ -17,8 +17,11 @@ https://en.wikipedia.org/wiki/Italian_phonology
 
 import re
 import unicodedata
+from collections.abc import Iterator
+from pathlib import Path
 from typing import Final
 
+from kokorog2p._cache import cache_put, load_json_cache, save_json_cache
 from kokorog2p.base import G2PBase
 from kokorog2p.token import GToken
 
@@ -32,6 +35,9 @@ from kokorog2p.token import GToken
 # Vowels are straightforward
 VOWELS: Final[frozenset[str]] = frozenset("aeiouàèéìòóù")
 
+# Vowels left after accent normalization
+_PLAIN_VOWELS: Final[str] = "aeiou"
+
 # Consonants that don't change
 SIMPLE_CONSONANTS: Final[dict[str, str]] = {
     "b": "b",
@@ -46,6 +52,157 @@ SIMPLE_CONSONANTS: Final[dict[str, str]] = {
     "v": "v",
 }
 
+# Consonants whose plain doubling is marked as gemination. Doubled c and g
+# depend on the following vowel and have their own rules.
+_GEMINABLE: Final[dict[str, str]] = {**SIMPLE_CONSONANTS, "s": "s", "z": "ʦ"}
+
+# Accented vowels mark stress and are normalized to plain vowels
+_ACCENTED_RE: Final[re.Pattern[str]] = re.compile("[àèéìòóù]")
+_ACCENT_TABLE: Final[dict[int, int]] = str.maketrans("àèéìòóù", "aeeioou")
+
+
+class _DeleteMissing(dict[int, int]):
+    """str.translate table that deletes every code point it does not map."""
+
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+# Punctuation kept in the phoneme output; everything else is dropped
+_PUNCT_KEEP_TABLE: Final[_DeleteMissing] = _DeleteMissing(
+    (ord(c), ord(c)) for c in ";:,.!?-\"'()[]"
+)
+
+# Vowels followed by the primary stress mark, emitted as a single chunk
+_STRESSED_VOWELS: Final[dict[str, str]] = {v: v + "ˈ" for v in _PLAIN_VOWELS}
+
+# Precompiled patterns for preprocessing and tokenization
+_PO_RE: Final[re.Pattern[str]] = re.compile(r"\bpo'", re.IGNORECASE)
+_ELISION_RE: Final[re.Pattern[str]] = re.compile(r"([a-zA-Zàèéìòóù])'([a-zA-Zàèéìòóù])")
+_MULTISPACE_RE: Final[re.Pattern[str]] = re.compile(r" +")
+_TOKEN_RE: Final[re.Pattern[str]] = re.compile(
+    r"(?P<word>\w+)|(?P<punct>[^\w\s]+)|(?P<space>\s+)", re.UNICODE
+)
+
+
+def _grapheme_rules(mark_gemination: bool) -> list[tuple[str, str, int]]:
+    """Build the consonant grapheme rules for the Italian G2P.
+
+    Each rule is ``(pattern, phonemes, consumed)``. The pattern may be longer
+    than the number of consumed characters, which encodes right context
+    (e.g. ``sce`` emits ʃ but leaves the ``e`` for the vowel rules). A
+    trailing ``$`` anchors the pattern to the end of the word.
+
+    Args:
+        mark_gemination: Whether double consonants are marked with ː.
+
+    Returns:
+        List of grapheme rules.
+    """
+    rules: list[tuple[str, str, int]] = [
+        # Trigraphs: cqu -> kːw (acqua), cch -> kː (occhi), ggh -> ɡː
+        ("cqu", "kːw", 3),
+        ("cch", "kː", 3),
+        ("ggh", "ɡː", 3),
+        # gn -> ɲ (gnocchi)
+        ("gn", "ɲ", 2),
+        # gli -> ʎ (famiglia) before a vowel or word-final, else g + l
+        ("gli", "ɡ", 1),
+        ("gli$", "ʎ", 3),
+        # sc -> ʃ before e/i (pesce), sk otherwise
+        ("sc", "sk", 2),
+        ("sce", "ʃ", 2),
+        ("sci", "ʃ", 2),
+        # ch -> k (che, chi), gh -> ɡ (ghetto, ghiro), qu -> kw
+        ("ch", "k", 2),
+        ("gh", "ɡ", 2),
+        ("qu", "kw", 2),
+        # c -> ʧ before e/i (ciao, cento), k otherwise
+        ("c", "k", 1),
+        ("ce", "ʧ", 1),
+        ("ci", "ʧ", 1),
+        ("cc", "kː", 2),
+        # g -> ʤ before e/i (giorno, gente), ɡ otherwise
+        ("g", "ɡ", 1),
+        ("ge", "ʤ", 1),
+        ("gi", "ʤ", 1),
+        # The 'i' after soft g is dropped (mangia, giulia, gioca) ...
+        ("gia", "ʤ", 2),
+        ("gio", "ʤ", 2),
+        ("giu", "ʤ", 2),
+        # ... but kept before r/n (giorno, giornale)
+        ("gior", "ʤ", 1),
+        ("gion", "ʤ", 1),
+        ("gg", "ɡː", 2),
+        # Silent h and single letters from loan words
+        ("h", "", 1),
+        ("z", "ʦ", 1),
+        ("s", "s", 1),
+        ("j", "j", 1),
+        ("w", "w", 1),
+        ("x", "ks", 1),
+        ("y", "i", 1),
+    ]
+    rules.extend((c, p, 1) for c, p in SIMPLE_CONSONANTS.items())
+    rules.extend(("gli" + v, "ʎ", 3) for v in _PLAIN_VOWELS)
+
+    if mark_gemination:
+        # cci/cce -> ʧː (cappuccino), ggi/gge -> ʤː (oggi)
+        rules.extend(
+            [
+                ("gnn", "ɲː", 3),
+                ("cce", "ʧː", 2),
+                ("cci", "ʧː", 2),
+                ("gge", "ʤː", 2),
+                ("ggi", "ʤː", 2),
+            ]
+        )
+        # Double consonants -> long consonant (mamma -> mamːa, pizza -> piʦːa)
+        rules.extend((c + c, p + "ː", 2) for c, p in _GEMINABLE.items())
+    else:
+        rules.extend(
+            [("cce", "ʧ", 1), ("cci", "ʧ", 1), ("gge", "ʤ", 2), ("ggi", "ʤ", 2)]
+        )
+    # For ggio/ggia, skip the 'i' (formaggio -> formaʤːo)
+    gg = "ʤː" if mark_gemination else "ʤ"
+    rules.extend(("ggi" + v, gg, 3) for v in "aou")
+
+    return rules
+
+
+class _TrieNode:
+    """Node of the grapheme trie used by :class:`ItalianG2P`."""
+
+    __slots__ = ("children", "end_rule", "rule")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        # (phonemes, consumed) for a pattern ending at this node
+        self.rule: tuple[str, int] | None = None
+        # Same, but only when the node is reached at the end of the word
+        self.end_rule: tuple[str, int] | None = None
+
+
+def _build_trie(rules: list[tuple[str, str, int]]) -> _TrieNode:
+    """Build a grapheme trie from ``(pattern, phonemes, consumed)`` rules."""
+    root = _TrieNode()
+    for pattern, phonemes, consumed in rules:
+        at_end = pattern.endswith("$")
+        node = root
+        for char in pattern.rstrip("$"):
+            node = node.children.setdefault(char, _TrieNode())
+        if at_end:
+            node.end_rule = (phonemes, consumed)
+        else:
+            node.rule = (phonemes, consumed)
+    return root
+
+
+# Grapheme tries keyed by the mark_gemination option
+_GRAPHEME_TRIES: Final[dict[bool, _TrieNode]] = {
+    gem: _build_trie(_grapheme_rules(gem)) for gem in (True, False)
+}
+
 
 class ItalianG2P(G2PBase):
     """Italian G2P converter using rule-based phonemization.
@@ -61,21 +218,25 @@ class ItalianG2P(G2PBase):
         ...     print(f"{token.text} -> {token.phonemes}")
     """
 
-    # Punctuation normalization map
-    _PUNCT_MAP = {
-        chr(171): '"',  # «
-        chr(187): '"',  # »
-        chr(8216): "'",  # '
-        chr(8217): "'",  # '
-        chr(8220): '"',  # "
-        chr(8221): '"',  # "
-        chr(8212): "-",  # —
-        chr(8211): "-",  # –
-        chr(8230): "...",  # …
-    }
+    # Punctuation normalization table (also maps non-breaking spaces to spaces)
+    _PUNCT_TABLE: Final[dict[int, str]] = str.maketrans(
+        {
+            chr(171): '"',  # «
+            chr(187): '"',  # »
+            chr(8216): "'",  # '
+            chr(8217): "'",  # '
+            chr(8220): '"',  # "
+            chr(8221): '"',  # "
+            chr(8212): "-",  # —
+            chr(8211): "-",  # –
+            chr(8230): "...",  # …
+            "\u00a0": " ",
+            "\u202f": " ",
+        }
+    )
 
     # Small lexicon for exceptional words or common words with irregular patterns
-    _LEXICON = {
+    _LEXICON: Final[dict[str, str]] = {
         "scusa": "skuʦa",
         "scusi": "skuʦi",
         "poˈ": "poˈ",  # "po'" with stress (preprocessed)
@@ -83,12 +244,16 @@ class ItalianG2P(G2PBase):
         "olio": "oljo",  # 'i' is a semivowel [j]
     }
 
+    # Maximum number of entries in the per-instance word cache
+    _WORD_CACHE_SIZE: Final[int] = 8192
+
     def __init__(
         self,
         language: str = "it-it",
         use_espeak_fallback: bool = False,
         mark_stress: bool = True,
         mark_gemination: bool = True,
+        cache_path: str | Path | None = None,
     ) -> None:
         """Initialize the Italian G2P converter.
 
@@ -97,10 +262,24 @@ class ItalianG2P(G2PBase):
             use_espeak_fallback: Reserved for future espeak integration.
             mark_stress: Whether to mark primary stress with ˈ.
             mark_gemination: Whether to mark double consonants with ː.
+            cache_path: Optional JSON file used to persist the word cache
+                between runs. It is loaded here if it exists and written
+                by save_cache().
         """
         super().__init__(language=language, use_espeak_fallback=use_espeak_fallback)
         self.mark_stress = mark_stress
         self.mark_gemination = mark_gemination
+        # Cache: (word, mark_stress, mark_gemination) -> phonemes
+        self._word_cache: dict[tuple[str, bool, bool], str] = {}
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        if self.cache_path is not None and self.cache_path.exists():
+            load_json_cache(
+                self.cache_path,
+                self._word_cache,
+                key_size=3,
+                max_size=self._WORD_CACHE_SIZE,
+                name="Italian word cache",
+            )
 
     def __call__(self, text: str) -> list[GToken]:
         """Convert text to a list of tokens with phonemes.
@@ -120,26 +299,41 @@ class ItalianG2P(G2PBase):
         # Tokenize
         tokens = self._tokenize(text)
 
-        # Process tokens
-        for token in tokens:
-            # Skip tokens that already have phonemes (punctuation)
-            if token.phonemes is not None:
-                continue
+        # Convert each distinct word once; tokens that already have
+        # phonemes (punctuation) are skipped
+        words = {
+            token.text.lower()
+            for token in tokens
+            if token.phonemes is None and token.is_word
+        }
+        phonemes_by_word = {word: self._word_to_phonemes(word) for word in words}
 
-            # Convert word to phonemes
-            if token.is_word:
-                phonemes = self._word_to_phonemes(token.text)
+        # Process tokens, marking words without phonemes as unknown
+        for token in tokens:
+            if token.phonemes is None and token.is_word:
+                phonemes = phonemes_by_word[token.text.lower()]
                 if phonemes:
                     token.phonemes = phonemes
                     token.set("rating", 3)  # Rule-based rating
-
-        # Handle remaining unknown words
-        for token in tokens:
-            if token.phonemes is None and token.is_word:
-                token.phonemes = "?"
+                else:
+                    token.phonemes = "?"
 
         return tokens
 
+    def save_cache(self, path: str | Path | None = None) -> None:
+        """Write the word cache to disk.
+
+        Args:
+            path: Target file. Defaults to the cache_path given at init.
+
+        Raises:
+            ValueError: If no path is given and no cache_path was set.
+        """
+        target = Path(path) if path is not None else self.cache_path
+        if target is None:
+            raise ValueError("No cache path given")
+        save_json_cache(target, self._word_cache)
+
     def _preprocess(self, text: str) -> str:
         """Preprocess text before G2P conversion.
 
@@ -152,28 +346,41 @@ class ItalianG2P(G2PBase):
         # Normalize Unicode
         text = unicodedata.normalize("NFC", text)
 
-        # Normalize punctuation
-        for old, new in self._PUNCT_MAP.items():
-            text = text.replace(old, new)
+        # Normalize punctuation and non-breaking spaces
+        text = text.translate(self._PUNCT_TABLE)
 
         # Handle specific Italian contractions/abbreviations
         # "po'" (poco) with final apostrophe indicates stress
-        text = re.sub(r"\bpo'", "poˈ", text, flags=re.IGNORECASE)
+        text = _PO_RE.sub("poˈ", text)
 
         # Handle Italian contractions with apostrophes
         # c'è -> cè, l'uomo -> luomo, etc.
         # Remove apostrophes that appear between letters
-        text = re.sub(r"([a-zA-Zàèéìòóù])'([a-zA-Zàèéìòóù])", r"\1\2", text)
-
-        # Remove non-breaking spaces
-        text = text.replace("\u00a0", " ")
-        text = text.replace("\u202f", " ")
+        text = _ELISION_RE.sub(r"\1\2", text)
 
         # Collapse multiple spaces
-        text = re.sub(r" +", " ", text)
+        text = _MULTISPACE_RE.sub(" ", text)
 
         return text.strip()
 
+    @staticmethod
+    def _split(text: str) -> Iterator[tuple[str, str]]:
+        """Split preprocessed text into classified pieces.
+
+        Args:
+            text: Preprocessed text.
+
+        Yields:
+            Tuples of (kind, piece) where kind is "word", "punct" or "space".
+        """
+        for match in _TOKEN_RE.finditer(text):
+            kind = match.lastgroup
+            piece = match.group()
+            # \w also matches runs of bare underscores, which are punctuation
+            if kind == "word" and not piece.strip("_"):
+                kind = "punct"
+            yield kind, piece  # type: ignore[misc]
+
     def _tokenize(self, text: str) -> list[GToken]:
         """Tokenize text into words and punctuation.
 
@@ -186,9 +393,8 @@ class ItalianG2P(G2PBase):
         tokens: list[GToken] = []
 
         # Simple word/punct split
-        for match in re.finditer(r"(\w+|[^\w\s]+|\s+)", text, re.UNICODE):
-            word = match.group()
-            if word.isspace():
+        for kind, word in self._split(text):
+            if kind == "space":
                 if tokens:
                     tokens[-1].whitespace = word
                 continue
@@ -196,7 +402,7 @@ class ItalianG2P(G2PBase):
             token = GToken(text=word, tag="", whitespace="")
 
             # Handle punctuation
-            if not any(c.isalnum() for c in word):
+            if kind == "punct":
                 token.phonemes = self._get_punct_phonemes(word)
                 token.set("rating", 4)
 
@@ -208,272 +414,25 @@ class ItalianG2P(G2PBase):
     def _get_punct_phonemes(text: str) -> str:
         """Get phonemes for punctuation tokens."""
         # Keep common punctuation
-        puncts = frozenset(";:,.!?-\"'()[]")
-        return "".join(c for c in text if c in puncts)
+        return text.translate(_PUNCT_KEEP_TABLE)
 
-    def _process_digraphs(
-        self, text: str, i: int, n: int
-    ) -> tuple[list[str], int, bool]:
-        """Process two-letter graphemes (gn, gli, gl, sc, ch, gh, qu).
-
-        Returns:
-            Tuple of (phonemes, new_position, matched).
-        """
-        result = []
-
-        # gn -> ɲ (gnocchi), check for doubling after
-        if i + 1 < n and text[i : i + 2] == "gn":
-            result.append("ɲ")
-            new_i = i + 2
-            # Check if followed by another consonant for gemination
-            if self.mark_gemination and new_i < n and text[new_i] == "n":
-                result.append("ː")
-                new_i += 1
-            return result, new_i, True
-
-        # gli -> ʎ (famiglia), but only before vowel or word-final
-        if i + 2 < n and text[i : i + 3] == "gli":
-            if i + 3 >= n or text[i + 3] in VOWELS:
-                result.append("ʎ")
-                return result, i + 3, True
-            # gl before non-vowel -> g + l
-            result.append("ɡ")
-            return result, i + 1, True
-
-        # gl before i -> ʎ
-        if i + 1 < n and text[i : i + 2] == "gl" and i + 2 < n and text[i + 2] == "i":
-            result.append("ʎ")
-            return result, i + 2, True
-
-        # sc before e/i -> ʃ (pesce)
-        if i + 1 < n and text[i : i + 2] == "sc":
-            if i + 2 < n and text[i + 2] in "ei":
-                result.append("ʃ")
-            else:
-                # sc before other -> sk
-                result.append("s")
-                result.append("k")
-            return result, i + 2, True
-
-        # ch -> k (che, chi)
-        if i + 1 < n and text[i : i + 2] == "ch":
-            result.append("k")
-            return result, i + 2, True
-
-        # gh -> ɡ (ghetto, ghiro)
-        if i + 1 < n and text[i : i + 2] == "gh":
-            result.append("ɡ")
-            return result, i + 2, True
-
-        # qu -> kw
-        if i + 1 < n and text[i : i + 2] == "qu":
-            result.append("k")
-            result.append("w")
-            return result, i + 2, True
-
-        return [], i, False
-
-    def _process_trigraphs(
-        self, text: str, i: int, n: int
-    ) -> tuple[list[str], int, bool]:
-        """Process three-letter graphemes (cqu, cch, ggh) and special uo.
-
-        Returns:
-            Tuple of (phonemes, new_position, matched).
-        """
-        result = []
-
-        # uo -> wo at word start (uomo -> womo)
-        if i == 0 and i + 1 < n and text[i : i + 2] == "uo":
-            result.append("w")
-            result.append("o")
-            return result, i + 2, True
-
-        # cqu -> kːw (acqua)
-        if i + 2 < n and text[i : i + 3] == "cqu":
-            result.append("k")
-            result.append("ː")
-            result.append("w")
-            return result, i + 3, True
-
-        # cch -> kːk  (occhi)
-        if i + 2 < n and text[i : i + 3] == "cch":
-            result.append("k")
-            result.append("ː")
-            return result, i + 2, True
-
-        # ggh -> ɡːɡ (agghiacciare)
-        if i + 2 < n and text[i : i + 3] == "ggh":
-            result.append("ɡ")
-            result.append("ː")
-            return result, i + 2, True
-
-        return [], i, False
-
-    def _process_c_consonant(
-        self, text: str, i: int, n: int
-    ) -> tuple[list[str], int, bool]:
-        """Process 'c' with context rules.
-
-        Returns:
-            Tuple of (phonemes, new_position, matched).
-        """
-        result = []
-
-        # cci/cce -> ʧː (cappuccino)
-        if i + 2 < n and text[i : i + 2] == "cc" and text[i + 2] in "ei":
-            if self.mark_gemination:
-                result.append("ʧ")
-                result.append("ː")
-                return result, i + 2, True
-            result.append("ʧ")
-            return result, i + 1, True
-
-        # ci/ce -> ʧ (ciao, cento)
-        if i + 1 < n and text[i + 1] in "ei":
-            result.append("ʧ")
-            return result, i + 1, True
-
-        if i + 1 < n and text[i + 1] == "c":
-            # Double c before a/o/u -> k:
-            result.append("k")
-            result.append("ː")
-            return result, i + 2, True
-
-        # c before a/o/u -> k
-        result.append("k")
-        return result, i + 1, True
-
-    def _process_g_consonant(
-        self, text: str, i: int, n: int
-    ) -> tuple[list[str], int, bool]:
-        """Process 'g' with context rules.
+    def _word_to_phonemes(self, word: str) -> str:
+        """Convert a single word to phonemes, using the word cache.
 
-        Returns:
-            Tuple of (phonemes, new_position, matched).
-        """
-        result = []
-
-        # ggi/gge -> ʤː (oggi)
-        if i + 2 < n and text[i : i + 2] == "gg" and text[i + 2] in "ei":
-            new_i = i + 2
-            if self.mark_gemination:
-                result.append("ʤ")
-                result.append("ː")
-                # For ggio/ggia, skip the 'i' (formaggio -> formaʤːo)
-                if text[new_i] == "i" and new_i + 1 < n and text[new_i + 1] in "aou":
-                    new_i += 1
-            else:
-                result.append("ʤ")
-                # For ggio/ggia, skip the 'i' even without gemination
-                if text[new_i] == "i" and new_i + 1 < n and text[new_i + 1] in "aou":
-                    new_i += 1
-            return result, new_i, True
-
-        # gi/ge -> ʤ (giorno, gente)
-        if i + 1 < n and text[i + 1] in "ei":
-            result.append("ʤ")
-            new_i = i + 1
-            # Handle 'i' after soft g
-            if text[new_i] == "i" and new_i + 1 < n:
-                next_char = text[new_i + 1]
-                if next_char == "o":
-                    # Check if followed by r or n
-                    if new_i + 2 < n and text[new_i + 2] in "rn":
-                        # Keep the 'i' (giorno, giornale)
-                        pass
-                    else:
-                        # Drop the 'i' (gioca, giocatore)
-                        new_i += 1
-                elif next_char in "au":
-                    # Drop the 'i' (mangia, giulia)
-                    new_i += 1
-            return result, new_i, True
-
-        if i + 1 < n and text[i + 1] == "g":
-            # Double g before a/o/u -> ɡ:
-            result.append("ɡ")
-            result.append("ː")
-            return result, i + 2, True
-
-        # g before a/o/u -> ɡ
-        result.append("ɡ")
-        return result, i + 1, True
-
-    def _process_simple_chars(
-        self, text: str, i: int, n: int, stressed_vowels: set[int]
-    ) -> tuple[list[str], int, bool]:
-        """Process simple characters (z, h, s, consonants, vowels, j, w, x, y).
+        Args:
+            word: Word to convert.
 
         Returns:
-            Tuple of (phonemes, new_position, matched).
+            Phoneme string in IPA.
         """
-        char = text[i]
-        result = []
-
-        # z -> ʦ or ʣ
-        if char == "z":
-            if self.mark_gemination and i + 1 < n and text[i + 1] == "z":
-                result.append("ʦ")
-                result.append("ː")
-                return result, i + 2, True
-            result.append("ʦ")
-            return result, i + 1, True
-
-        # h is silent
-        if char == "h":
-            return result, i + 1, True
-
-        # s -> s
-        if char == "s":
-            if self.mark_gemination and i + 1 < n and text[i + 1] == "s":
-                result.append("s")
-                result.append("ː")
-                return result, i + 2, True
-            result.append("s")
-            return result, i + 1, True
-
-        # Simple consonants
-        if char in SIMPLE_CONSONANTS:
-            consonant = SIMPLE_CONSONANTS[char]
-            if self.mark_gemination and i + 1 < n and text[i + 1] == char:
-                result.append(consonant)
-                result.append("ː")
-                return result, i + 2, True
-            result.append(consonant)
-            return result, i + 1, True
-
-        # Vowels
-        if char in "aeiou":
-            result.append(char)
-            if self.mark_stress and i in stressed_vowels:
-                result.append("ˈ")
-            return result, i + 1, True
-
-        # j -> j (semivowel)
-        if char == "j":
-            result.append("j")
-            return result, i + 1, True
-
-        # w -> w (in loan words)
-        if char == "w":
-            result.append("w")
-            return result, i + 1, True
-
-        # x -> ks (in loan words)
-        if char == "x":
-            result.append("k")
-            result.append("s")
-            return result, i + 1, True
-
-        # y -> i (in loan words)
-        if char == "y":
-            result.append("i")
-            return result, i + 1, True
-
-        return [], i, False
-
-    def _word_to_phonemes(self, word: str) -> str:
+        key = (word, self.mark_stress, self.mark_gemination)
+        phonemes = self._word_cache.get(key)
+        if phonemes is None:
+            phonemes = self._convert_word(word)
+            cache_put(self._word_cache, key, phonemes, self._WORD_CACHE_SIZE)
+        return phonemes
+
+    def _convert_word(self, word: str) -> str:
         """Convert a single word to phonemes using Italian rules.
 
         Args:
@@ -485,10 +444,12 @@ class ItalianG2P(G2PBase):
         if not word:
             return ""
 
+        # Convert to lowercase for processing
+        text = word.lower()
+
         # Check lexicon first for exceptional words
-        word_lower = word.lower()
-        if word_lower in self._LEXICON:
-            base_phonemes = self._LEXICON[word_lower]
+        base_phonemes = self._LEXICON.get(text)
+        if base_phonemes is not None:
             # Apply stress and gemination markers if needed
             if not self.mark_stress:
                 base_phonemes = base_phonemes.replace("ˈ", "")
@@ -496,82 +457,66 @@ class ItalianG2P(G2PBase):
                 base_phonemes = base_phonemes.replace("ː", "")
             return base_phonemes
 
-        # Convert to lowercase for processing
-        text = word.lower()
-
-        # Find stressed vowels before normalization
-        stressed_vowels = set()
-        normalized_text = []
-        for _i, char in enumerate(text):
-            if char in "àèéìòóù":
-                # Remember the position of the normalized vowel
-                stressed_vowels.add(len(normalized_text))
-                # Normalize the accented vowel
-                if char == "à":
-                    normalized_text.append("a")
-                elif char in "èé":
-                    normalized_text.append("e")
-                elif char == "ì":
-                    normalized_text.append("i")
-                elif char in "òó":
-                    normalized_text.append("o")
-                elif char == "ù":
-                    normalized_text.append("u")
-            else:
-                normalized_text.append(char)
+        # Find stressed vowels before normalization (bit i set = text[i] stressed)
+        stressed_mask = 0
+        if not text.isascii():
+            for accent in _ACCENTED_RE.finditer(text):
+                stressed_mask |= 1 << accent.start()
 
-        text = "".join(normalized_text)
+            # Normalize the accented vowels (1:1, so positions are unchanged)
+            text = text.translate(_ACCENT_TABLE)
 
         result: list[str] = []
+        append = result.append
         i = 0
         n = len(text)
+        roots = _GRAPHEME_TRIES[self.mark_gemination].children
+        mark_stress = self.mark_stress
+        vowels = _PLAIN_VOWELS
+        stressed_vowels = _STRESSED_VOWELS
+
+        # uo -> wo at word start (uomo -> womo)
+        if text.startswith("uo"):
+            append("wo")
+            i = 2
 
         while i < n:
-            matched = False
-
-            # Try trigraphs first (uo, cqu, cch, ggh)
-            phonemes, new_i, was_matched = self._process_trigraphs(text, i, n)
-            if was_matched:
-                result.extend(phonemes)
-                i = new_i
-                matched = True
-
-            # Try digraphs (gn, gli, gl, sc, ch, gh, qu)
-            if not matched:
-                phonemes, new_i, was_matched = self._process_digraphs(text, i, n)
-                if was_matched:
-                    result.extend(phonemes)
-                    i = new_i
-                    matched = True
-
-            # Process 'c' with context
-            if not matched and text[i] == "c":
-                phonemes, new_i, was_matched = self._process_c_consonant(text, i, n)
-                result.extend(phonemes)
-                i = new_i
-                matched = True
-
-            # Process 'g' with context
-            if not matched and text[i] == "g":
-                phonemes, new_i, was_matched = self._process_g_consonant(text, i, n)
-                result.extend(phonemes)
-                i = new_i
-                matched = True
-
-            # Process simple characters (z, h, s, consonants, vowels, j, w, x, y)
-            if not matched:
-                phonemes, new_i, was_matched = self._process_simple_chars(
-                    text, i, n, stressed_vowels
-                )
-                if was_matched:
-                    result.extend(phonemes)
-                    i = new_i
-                    matched = True
-
-            # Unknown character
-            if not matched:
+            char = text[i]
+
+            # Vowels, with the stress mark after an accented vowel
+            if char in vowels:
+                if mark_stress and stressed_mask >> i & 1:
+                    append(stressed_vowels[char])
+                else:
+                    append(char)
+                i += 1
+                continue
+
+            # Consonant graphemes: walk the trie for the longest match
+            node = roots.get(char)
+            if node is None:
                 # Skip unknown characters
                 i += 1
+                continue
+            match = node.rule
+            j = i + 1
+            while j < n:
+                child = node.children.get(text[j])
+                if child is None:
+                    break
+                node = child
+                j += 1
+                if node.rule is not None:
+                    match = node.rule
+            else:
+                if node.end_rule is not None:
+                    match = node.end_rule
+            if match is None:
+                i += 1
+                continue
+            phonemes, consumed = match
+            append(phonemes)
+            i += consumed
 
         return "".join(result)
 
@@ -596,13 +541,22 @@ class ItalianG2P(G2PBase):
         Returns:
             Phoneme string.
         """
-        tokens = self(text)
-        result = []
-        for token in tokens:
-            if token.phonemes:
-                result.append(token.phonemes)
-                if token.whitespace:
-                    result.append(token.whitespace)
+        # Same pipeline as __call__, without building GToken objects
+        result: list[str] = []
+        keep_space = False
+        for kind, piece in self._split(self._preprocess(text)):
+            if kind == "space":
+                # Whitespace is kept only after a piece with phonemes
+                if keep_space:
+                    result.append(piece)
+                continue
+            if kind == "punct":
+                phonemes = self._get_punct_phonemes(piece)
+            else:
+                phonemes = self._word_to_phonemes(piece.lower()) or "?"
+            if phonemes:
+                result.append(phonemes)
+            keep_space = bool(phonemes)
         return "".join(result).rstrip()
 
     def __repr__(self) -> str:
@@ -174,6 +174,16 @@ FROM_ESPEAK: Final[list[tuple[str, str]]] = sorted(
     _ESPEAK_MAPPINGS.items(), key=lambda kv: -len(kv[0])
 )
 
+# Syllabic consonant: any character followed by U+0329
+_ESPEAK_SYLLABIC_RE: Final[re.Pattern[str]] = re.compile(r"(\S)\u0329")
+
+# Syllabic l (ə͡l or ə^l) after a consonant
+_ESPEAK_CONSONANT: Final[str] = r"[bdfhjklmnpstvwzðŋɡɹɾʃʒʤʧθʔ]"
+_ESPEAK_SYLLABIC_L_RE: Final[re.Pattern[str]] = re.compile(f"({_ESPEAK_CONSONANT})ə͡l")
+_ESPEAK_SYLLABIC_L_CARET_RE: Final[re.Pattern[str]] = re.compile(
+    f"({_ESPEAK_CONSONANT})ə\\^l"
+)
+
 # =============================================================================
 # IPA to Kokoro Mappings (for goruut conversion)
 # =============================================================================
@@ -244,6 +254,9 @@ def from_espeak(phonemes: str, british: bool = False) -> str:
         >>> from_espeak("mˈɜːt͡ʃənt͡ʃˌɪp", british=False)
         'mˈɜɹʧəntʃˌɪp'
     """
+    if not phonemes:
+        return phonemes
+
     result = phonemes
 
     # Apply standard mappings
@@ -251,15 +264,17 @@ def from_espeak(phonemes: str, british: bool = False) -> str:
         result = result.replace(old, new)
 
     # Handle syllabic consonants (U+0329 combining mark)
-    result = re.sub(r"(\S)\u0329", r"ᵊ\1", result)
-    result = result.replace(chr(809), "")
+    if "\u0329" in result:
+        result = _ESPEAK_SYLLABIC_RE.sub(r"ᵊ\1", result)
+        result = result.replace("\u0329", "")
 
     # Handle syllabic l: ə͡l -> ᵊl only after consonants (not after vowels)
     # This prevents "material" (vowel + ə͡l) from becoming "materiᵊl"
     # while "little" (consonant + ə͡l) correctly becomes "littᵊl"
-    _consonants_pattern = r"[bdfhjklmnpstvwzðŋɡɹɾʃʒʤʧθʔ]"
-    result = re.sub(f"({_consonants_pattern})ə͡l", r"\1ᵊl", result)
-    result = re.sub(f"({_consonants_pattern})ə\\^l", r"\1ᵊl", result)
+    if "ə͡l" in result:
+        result = _ESPEAK_SYLLABIC_L_RE.sub(r"\1ᵊl", result)
+    if "ə^l" in result:
+        result = _ESPEAK_SYLLABIC_L_CARET_RE.sub(r"\1ᵊl", result)
 
     # Apply dialect-specific mappings
     if british:
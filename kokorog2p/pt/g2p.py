@@ -20,8 +20,10 @@ https://en.wikipedia.org/wiki/Brazilian_Portuguese
 
 import re
 import unicodedata
+from collections.abc import Callable
 from typing import Final
 
+from kokorog2p._cache import cache_put
 from kokorog2p.base import G2PBase
 from kokorog2p.token import GToken
 
@@ -44,6 +46,81 @@ SIMPLE_CONSONANTS: Final[dict[str, str]] = {
     "v": "v",
 }
 
+# Letters that map to a single phoneme regardless of context
+_SINGLE_LETTERS: Final[dict[str, str]] = {
+    **SIMPLE_CONSONANTS,
+    "ç": "s",
+    "j": "ʒ",
+    "x": "ʃ",
+    "m": "m",
+    "w": "w",
+    "y": "j",
+}
+
+# Context-free letters keyed by the affricate_ti_di option
+# (without affrication, d never depends on its context)
+_SINGLE_LETTERS_BY_AFFRICATION: Final[dict[bool, dict[str, str]]] = {
+    True: _SINGLE_LETTERS,
+    False: {**_SINGLE_LETTERS, "d": "d"},
+}
+
+# Multi-letter graphemes read as a single phoneme
+_MULTI_GRAPHEMES: Final[dict[str, str]] = {
+    "tch": "ʧ",  # Tchau
+    "nh": "ɲ",  # ninho
+    "lh": "ʎ",  # filho
+    "ch": "ʃ",  # chá
+    "rr": "r",  # carro (strong r)
+    "ss": "s",  # isso
+}
+
+
+class _TrieNode:
+    """Node of the multi-letter grapheme trie used by :class:`PortugueseG2P`."""
+
+    __slots__ = ("children", "phonemes")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        # Phonemes of a grapheme ending at this node
+        self.phonemes: str | None = None
+
+
+def _build_trie(graphemes: dict[str, str]) -> _TrieNode:
+    """Build a grapheme trie from a ``grapheme -> phonemes`` mapping."""
+    root = _TrieNode()
+    for grapheme, phonemes in graphemes.items():
+        node = root
+        for char in grapheme:
+            node = node.children.setdefault(char, _TrieNode())
+        node.phonemes = phonemes
+    return root
+
+
+_GRAPHEME_TRIE: Final[_TrieNode] = _build_trie(_MULTI_GRAPHEMES)
+
+# Oral vowel -> nasal vowel before a syllable-final m/n
+_NASALIZED: Final[dict[str, str]] = {"a": "ã", "e": "ẽ", "i": "ĩ", "o": "õ", "u": "ũ"}
+
+# Accented vowels mark stress and are normalized to plain vowels; ã/õ keep
+# their tilde for the nasal rules (â has no mapping and is dropped)
+_UNACCENTED: Final[dict[str, str]] = {
+    "á": "a",
+    "é": "e",
+    "ê": "e",
+    "í": "i",
+    "ó": "o",
+    "ô": "o",
+    "ú": "u",
+    "â": "",
+    "ã": "ã",
+    "õ": "õ",
+}
+
+# Precompiled patterns for preprocessing and tokenization
+_MULTISPACE_RE: Final[re.Pattern[str]] = re.compile(r" +")
+_TOKEN_RE: Final[re.Pattern[str]] = re.compile(r"(?P<word>[\w'-]+)|(?P<punct>[^\w'-]+)")
+
 
 class PortugueseG2P(G2PBase):
     """Brazilian Portuguese G2P converter using rule-based phonemization.
@@ -58,18 +135,22 @@ class PortugueseG2P(G2PBase):
         ...     print(f"{token.text} -> {token.phonemes}")
     """
 
-    # Punctuation normalization map
-    _PUNCT_MAP = {
-        chr(171): '"',  # «
-        chr(187): '"',  # »
-        chr(8216): "'",  # '
-        chr(8217): "'",  # '
-        chr(8220): '"',  # "
-        chr(8221): '"',  # "
-        chr(8212): "-",  # —
-        chr(8211): "-",  # –
-        chr(8230): "...",  # …
-    }
+    # Punctuation normalization table (also maps non-breaking spaces to spaces)
+    _PUNCT_TABLE: Final[dict[int, str]] = str.maketrans(
+        {
+            chr(171): '"',  # «
+            chr(187): '"',  # »
+            chr(8216): "'",  # '
+            chr(8217): "'",  # '
+            chr(8220): '"',  # "
+            chr(8221): '"',  # "
+            chr(8212): "-",  # —
+            chr(8211): "-",  # –
+            chr(8230): "...",  # …
+            "\u00a0": " ",
+            "\u202f": " ",
+        }
+    )
 
     # Small lexicon for exceptional words
     _LEXICON: dict[str, str] = {
@@ -79,6 +160,9 @@ class PortugueseG2P(G2PBase):
         # Add more as needed
     }
 
+    # Maximum number of entries in the per-instance word cache
+    _WORD_CACHE_SIZE: Final[int] = 50000
+
     def __init__(
         self,
         language: str = "pt-br",
@@ -97,6 +181,7 @@ class PortugueseG2P(G2PBase):
         super().__init__(language=language, use_espeak_fallback=use_espeak_fallback)
         self.mark_stress = mark_stress
         self.affricate_ti_di = affricate_ti_di
+        self._word_cache: dict[tuple[str, bool, bool], str] = {}
 
     def __call__(self, text: str) -> list[GToken]:
         """Convert text to a list of tokens with phonemes.
@@ -116,23 +201,24 @@ class PortugueseG2P(G2PBase):
         # Tokenize
         tokens = self._tokenize(text)
 
-        # Process tokens
-        for token in tokens:
-            # Skip tokens that already have phonemes (punctuation)
-            if token.phonemes is not None:
-                continue
+        # Convert each distinct word once; tokens that already have
+        # phonemes (punctuation) are skipped
+        words = {
+            token.text.lower()
+            for token in tokens
+            if token.phonemes is None and token.is_word
+        }
+        phonemes_by_word = {word: self._word_to_phonemes(word) for word in words}
 
-            # Convert word to phonemes
-            if token.is_word:
-                phonemes = self._word_to_phonemes(token.text)
+        # Process tokens, marking words without phonemes as unknown
+        for token in tokens:
+            if token.phonemes is None and token.is_word:
+                phonemes = phonemes_by_word[token.text.lower()]
                 if phonemes:
                     token.phonemes = phonemes
                     token.set("rating", 3)  # Rule-based rating
-
-        # Handle remaining unknown words
-        for token in tokens:
-            if token.phonemes is None and token.is_word:
-                token.phonemes = "?"
+                else:
+                    token.phonemes = "?"
 
         return tokens
 
@@ -148,16 +234,11 @@ class PortugueseG2P(G2PBase):
         # Normalize Unicode
         text = unicodedata.normalize("NFC", text)
 
-        # Normalize punctuation
-        for old, new in self._PUNCT_MAP.items():
-            text = text.replace(old, new)
-
-        # Remove non-breaking spaces
-        text = text.replace("\u00a0", " ")
-        text = text.replace("\u202f", " ")
+        # Normalize punctuation and non-breaking spaces
+        text = text.translate(self._PUNCT_TABLE)
 
         # Collapse multiple spaces
-        text = re.sub(r" +", " ", text)
+        text = _MULTISPACE_RE.sub(" ", text)
 
         return text.strip()
 
@@ -170,66 +251,51 @@ class PortugueseG2P(G2PBase):
         Returns:
             List of GToken objects.
         """
-        # Pattern to split on whitespace and capture punctuation
-        pattern = r"([^\w'-]+|[\w'-]+)"
-        parts = re.findall(pattern, text)
-
         tokens = []
-        for part in parts:
-            if not part or part.isspace():
-                continue
-
-            # Check if it's a word or punctuation
-            if re.match(r"[\w'-]+", part):
-                # It's a word
+        # The matching group tells words and punctuation apart
+        for match in _TOKEN_RE.finditer(text):
+            part = match.group()
+            if match.lastgroup == "word":
                 token = GToken(text=part)
                 token.set("is_word", True)
-                tokens.append(token)
+            elif part.isspace():
+                continue
             else:
-                # It's punctuation
                 token = GToken(text=part)
                 token.set("is_word", False)
                 token.phonemes = part  # Punctuation passes through
-                tokens.append(token)
+            tokens.append(token)
 
         return tokens
 
-    def _normalize_text(self, text: str) -> tuple[str, set[int], set[int]]:
+    def _normalize_text(self, text: str) -> tuple[str, bytearray, bytearray]:
         """Normalize accented characters and track stress positions.
 
         Args:
             text: Input text with possible accents.
 
         Returns:
-            Tuple of (normalized_text, stressed_vowel_positions,
-            open_vowel_positions).
+            Tuple of (normalized_text, stressed_vowels, open_vowels), where
+            the last two are bitmaps with a non-zero byte at each stressed
+            or open (acute) vowel position.
         """
-        stressed_vowels = set()
-        open_vowels = set()  # Track é/ó (open) vs ê/ô (closed)
-        normalized_text = []
+        # Normalization never lengthens the text, so len(text) bytes suffice
+        stressed_vowels = bytearray(len(text))
+        open_vowels = bytearray(len(text))  # Track é/ó (open) vs ê/ô (closed)
+        normalized_text: list[str] = []
 
-        for _i, char in enumerate(text):
+        for char in text:
             if char in "áéíóúâêôãõ":
                 # Remember position
                 pos = len(normalized_text)
-                stressed_vowels.add(pos)
+                stressed_vowels[pos] = 1
                 # Track open vowels (acute accent)
                 if char in "éó":
-                    open_vowels.add(pos)
+                    open_vowels[pos] = 1
                 # Normalize
-                if char == "á":
-                    normalized_text.append("a")
-                elif char in ("é", "ê"):
-                    normalized_text.append("e")
-                elif char == "í":
-                    normalized_text.append("i")
-                elif char in ("ó", "ô"):
-                    normalized_text.append("o")
-                elif char == "ú":
-                    normalized_text.append("u")
-                elif char in ("ã", "õ"):
-                    # Keep tilde for later
-                    normalized_text.append(char)
+                plain = _UNACCENTED[char]
+                if plain:
+                    normalized_text.append(plain)
             else:
                 normalized_text.append(char)
 
@@ -240,312 +306,295 @@ class PortugueseG2P(G2PBase):
         text: str,
         i: int,
         n: int,
-        stressed_vowels: set[int],
-        open_vowels: set[int],
-    ) -> tuple[list[str], int]:
-        """Process a vowel and possible diphthong.
+        stressed_vowels: bytearray,
+        open_vowels: bytearray,
+    ) -> tuple[str, int]:
+        """Process a vowel, a nasal vowel or a diphthong.
 
         Args:
             text: Normalized text.
             i: Current position.
             n: Text length.
-            stressed_vowels: Set of stressed vowel positions.
-            open_vowels: Set of open vowel positions.
+            stressed_vowels: Bitmap of stressed vowel positions.
+            open_vowels: Bitmap of open vowel positions.
 
         Returns:
             Tuple of (phonemes, new_position).
         """
         vowel = text[i]
-        result = []
+        # Read the following letter once ("" at the end of the word)
+        next_char = text[i + 1] if i + 1 < n else ""
+
+        # Vowel + m/n not followed by a vowel or h -> nasal vowel
+        if next_char in ("m", "n") and (i + 2 >= n or text[i + 2] not in "aeiouãõh"):
+            stress = "ˈ" if stressed_vowels[i] else ""
+            return _NASALIZED[vowel] + stress + next_char, i + 2
 
         if vowel == "e":
             # Use open ɛ only if stressed AND has acute accent (é)
-            if i in stressed_vowels and i in open_vowels:
-                result.append("ɛ")
+            if stressed_vowels[i] and open_vowels[i]:
+                phonemes = "ɛ"
             else:
-                result.append("e")
+                phonemes = "e"
             # Check for eu diphthong -> ew (meu, seu)
-            if i + 1 < n and text[i + 1] == "u":
-                result.append("w")
+            if next_char == "u":
+                phonemes += "w"
                 i += 1
 
         elif vowel == "o":
             # Use open ɔ only if stressed AND has acute accent (ó)
-            if i in stressed_vowels and i in open_vowels:
-                result.append("ɔ")
+            if stressed_vowels[i] and open_vowels[i]:
+                phonemes = "ɔ"
             else:
-                result.append("o")
+                phonemes = "o"
             # Check for ou diphthong -> ow (vou, sou)
-            if i + 1 < n and text[i + 1] == "u":
-                result.append("w")
+            if next_char == "u":
+                phonemes += "w"
                 i += 1
 
         elif vowel == "u":
-            result.append("u")
+            phonemes = "u"
             # Check for ui diphthong -> uj (muito)
-            if i + 1 < n and text[i + 1] == "i":
-                result.append("j")
+            if next_char == "i":
+                phonemes += "j"
                 i += 1
 
         elif vowel == "a":
-            result.append("a")
+            phonemes = "a"
             # Check for au diphthong -> aw (Tchau, mau)
-            if i + 1 < n and text[i + 1] == "u":
-                result.append("w")
+            if next_char == "u":
+                phonemes += "w"
                 i += 1
 
-        elif vowel == "i":
-            result.append("i")
+        else:
+            phonemes = "i"
 
         # Add stress marker if applicable
-        if self.mark_stress and i in stressed_vowels:
-            result.append("ˈ")
+        if stressed_vowels[i]:
+            phonemes += "ˈ"
 
-        return result, i + 1
+        return phonemes, i + 1
 
-    def _process_t_consonant(
-        self, text: str, i: int, n: int, stressed_vowels: set[int]
-    ) -> tuple[list[str], int, bool]:
-        """Process 't' consonant with possible affrication.
-
-        Returns:
-            Tuple of (phonemes, new_position, matched).
-        """
-        result = []
-        matched = False
-
-        if self.affricate_ti_di:
-            # Final "te" -> ʧi
-            if (
-                i + 1 < n
-                and text[i + 1] == "e"
-                and (i + 1) not in stressed_vowels
-                and i + 2 >= n
-            ):
-                result.extend(["ʧ", "i"])
-                return result, i + 2, True
-            # t + i (unstressed) -> ʧ
-            if i + 1 < n and text[i + 1] == "i" and (i + 1) not in stressed_vowels:
-                result.append("ʧ")
-                return result, i + 1, True
-
-        result.append("t")
-        return result, i + 1, matched
-
-    def _process_d_consonant(
-        self, text: str, i: int, n: int, stressed_vowels: set[int]
-    ) -> tuple[list[str], int, bool]:
-        """Process 'd' consonant with possible affrication.
+    def _process_nasal_vowel(
+        self,
+        text: str,
+        i: int,
+        n: int,
+        stressed_vowels: bytearray,
+        open_vowels: bytearray,
+    ) -> tuple[str, int]:
+        """Process an already-nasalized vowel (ã, õ).
 
         Returns:
-            Tuple of (phonemes, new_position, matched).
+            Tuple of (phonemes, new_position).
         """
-        result = []
-        matched = False
-
-        if self.affricate_ti_di:
-            # d + i (unstressed) -> ʤ
-            if i + 1 < n and text[i + 1] == "i" and (i + 1) not in stressed_vowels:
-                result.append("ʤ")
-                return result, i + 1, True
+        if stressed_vowels[i]:
+            return text[i] + "ˈ", i + 1
+        return text[i], i + 1
 
-        result.append("d")
-        return result, i + 1, matched
-
-    def _process_nasal_vowel(
-        self, text: str, i: int, n: int, stressed_vowels: set[int]
-    ) -> tuple[list[str], int, bool]:
-        """Process nasal vowel combination.
+    def _process_t_consonant(
+        self,
+        text: str,
+        i: int,
+        n: int,
+        stressed_vowels: bytearray,
+        open_vowels: bytearray,
+    ) -> tuple[str, int]:
+        """Process 't' consonant with affrication.
 
         Returns:
-            Tuple of (phonemes, new_position, matched).
+            Tuple of (phonemes, new_position).
         """
-        if not (
+        # Final "te" -> ʧi
+        if (
             i + 1 < n
-            and text[i] in NASAL_VOWELS
-            and text[i + 1] in "mn"
-            and (i + 2 >= n or text[i + 2] not in "aeiouãõh")
+            and text[i + 1] == "e"
+            and not stressed_vowels[i + 1]
+            and i + 2 >= n
         ):
-            return [], i, False
-
-        result = []
-        vowel = text[i]
-
-        # Nasalize vowel
-        nasal_map = {"a": "ã", "e": "ẽ", "i": "ĩ", "o": "õ", "u": "ũ"}
-        if vowel in nasal_map:
-            result.append(nasal_map[vowel])
-
-        # Add stress if needed
-        if self.mark_stress and i in stressed_vowels:
-            result.append("ˈ")
-
-        # Add nasal consonant
-        result.append(text[i + 1])
+            return "ʧi", i + 2
+        # t + i (unstressed) -> ʧ
+        if i + 1 < n and text[i + 1] == "i" and not stressed_vowels[i + 1]:
+            return "ʧ", i + 1
 
-        return result, i + 2, True
+        return "t", i + 1
 
-    def _process_multi_char_sequences(
-        self, text: str, i: int, n: int
-    ) -> tuple[list[str], int, bool]:
-        """Process multi-character grapheme sequences.
+    def _process_d_consonant(
+        self,
+        text: str,
+        i: int,
+        n: int,
+        stressed_vowels: bytearray,
+        open_vowels: bytearray,
+    ) -> tuple[str, int]:
+        """Process 'd' consonant with affrication.
 
         Returns:
-            Tuple of (phonemes, new_position, matched).
+            Tuple of (phonemes, new_position).
         """
-        result = []
+        # d + i (unstressed) -> ʤ
+        if i + 1 < n and text[i + 1] == "i" and not stressed_vowels[i + 1]:
+            return "ʤ", i + 1
 
-        # tch -> ʧ (Tchau, tchau)
-        if i + 2 < n and text[i : i + 3] == "tch":
-            result.append("ʧ")
-            return result, i + 3, True
-
-        # nh -> ɲ (ninho)
-        if i + 1 < n and text[i : i + 2] == "nh":
-            result.append("ɲ")
-            return result, i + 2, True
-
-        # lh -> ʎ (filho)
-        if i + 1 < n and text[i : i + 2] == "lh":
-            result.append("ʎ")
-            return result, i + 2, True
-
-        # ch -> ʃ (chá)
-        if i + 1 < n and text[i : i + 2] == "ch":
-            result.append("ʃ")
-            return result, i + 2, True
-
-        # rr -> r or ʁ (strong r: carro)
-        if i + 1 < n and text[i : i + 2] == "rr":
-            result.append("r")  # Use r for strong trill
-            return result, i + 2, True
-
-        # ss -> s (isso -> iso)
-        if i + 1 < n and text[i : i + 2] == "ss":
-            result.append("s")
-            return result, i + 2, True
-
-        # qu + vowel -> kw or k
-        if i + 2 < n and text[i : i + 2] == "qu":
-            if text[i + 2] in "ei":
-                result.append("k")
-            else:
-                result.append("k")
-                result.append("w")
-            return result, i + 2, True
+        return "d", i + 1
 
-        # gu + vowel -> ɡw or ɡ
-        if i + 2 < n and text[i : i + 2] == "gu":
-            if text[i + 2] in "ei":
-                result.append("ɡ")
-            else:
-                result.append("ɡ")
-                result.append("w")
-            return result, i + 2, True
+    def _process_plain_letter(
+        self,
+        text: str,
+        i: int,
+        n: int,
+        stressed_vowels: bytearray,
+        open_vowels: bytearray,
+    ) -> tuple[str, int]:
+        """Process a letter read as itself unless it starts a grapheme (n, t)."""
+        return text[i], i + 1
 
-        return [], i, False
+    def _process_l_consonant(
+        self,
+        text: str,
+        i: int,
+        n: int,
+        stressed_vowels: bytearray,
+        open_vowels: bytearray,
+    ) -> tuple[str, int]:
+        """Process 'l': w before consonant/final, else l."""
+        if i + 1 >= n or text[i + 1] not in "aeiouãõ":
+            return "w", i + 1
+        return "l", i + 1
+
+    def _process_c_consonant(
+        self,
+        text: str,
+        i: int,
+        n: int,
+        stressed_vowels: bytearray,
+        open_vowels: bytearray,
+    ) -> tuple[str, int]:
+        """Process 'c': s before e/i, otherwise k."""
+        if i + 1 < n and text[i + 1] in "ei":
+            return "s", i + 1
+        return "k", i + 1
+
+    def _process_r_consonant(
+        self,
+        text: str,
+        i: int,
+        n: int,
+        stressed_vowels: bytearray,
+        open_vowels: bytearray,
+    ) -> tuple[str, int]:
+        """Process 'r': initial r -> r (strong r), otherwise ɾ."""
+        if i == 0:
+            return "r", i + 1
+        return "ɾ", i + 1
+
+    def _process_s_consonant(
+        self,
+        text: str,
+        i: int,
+        n: int,
+        stressed_vowels: bytearray,
+        open_vowels: bytearray,
+    ) -> tuple[str, int]:
+        """Process 's': z between vowels, otherwise s."""
+        if (
+            i > 0
+            and i + 1 < n
+            and text[i - 1] in "aeiouãõ"
+            and text[i + 1] in "aeiouãõ"
+        ):
+            return "z", i + 1
+        return "s", i + 1
 
-    def _process_simple_consonants(
-        self, text: str, i: int, n: int, stressed_vowels: set[int]
-    ) -> tuple[list[str], int, bool]:
-        """Process simple consonants with context rules.
+    def _process_q_consonant(
+        self,
+        text: str,
+        i: int,
+        n: int,
+        stressed_vowels: bytearray,
+        open_vowels: bytearray,
+    ) -> tuple[str, int]:
+        """Process 'qu' + vowel -> k before e/i, otherwise kw."""
+        if i + 2 < n and text[i + 1] == "u":
+            if text[i + 2] in "ei":
+                return "k", i + 2
+            return "kw", i + 2
+        # Unknown without a following u - skip
+        return "", i + 1
 
-        Returns:
-            Tuple of (phonemes, new_position, matched).
-        """
-        char = text[i]
-        result = []
+    def _process_g_consonant(
+        self,
+        text: str,
+        i: int,
+        n: int,
+        stressed_vowels: bytearray,
+        open_vowels: bytearray,
+    ) -> tuple[str, int]:
+        """Process 'g': gu + vowel -> ɡ/ɡw, ʒ before e/i, otherwise ɡ."""
+        if i + 2 < n and text[i + 1] == "u":
+            if text[i + 2] in "ei":
+                return "ɡ", i + 2
+            return "ɡw", i + 2
+        if i + 1 < n and text[i + 1] in "ei":
+            return "ʒ", i + 1
+        return "ɡ", i + 1
 
-        # Simple consonants (b, f, k, p, v)
-        if char in SIMPLE_CONSONANTS:
-            result.append(SIMPLE_CONSONANTS[char])
-            return result, i + 1, True
+    def _process_z_consonant(
+        self,
+        text: str,
+        i: int,
+        n: int,
+        stressed_vowels: bytearray,
+        open_vowels: bytearray,
+    ) -> tuple[str, int]:
+        """Process 'z': final -> s, otherwise z."""
+        if i + 1 >= n:
+            return "s", i + 1
+        return "z", i + 1
+
+    # Rule dispatch table: first character -> processing method
+    # (context-free letters are handled inline)
+    _COMMON_HANDLERS: Final[dict[str, Callable[..., tuple[str, int]]]] = {
+        **dict.fromkeys(NASAL_VOWELS, _process_vowel),
+        **dict.fromkeys("ãõ", _process_nasal_vowel),
+        "n": _process_plain_letter,
+        "l": _process_l_consonant,
+        "c": _process_c_consonant,
+        "r": _process_r_consonant,
+        "s": _process_s_consonant,
+        "q": _process_q_consonant,
+        "g": _process_g_consonant,
+        "z": _process_z_consonant,
+    }
 
-        # c: before e/i -> s, otherwise k
-        if char == "c":
-            if i + 1 < n and text[i + 1] in "ei":
-                result.append("s")
-            else:
-                result.append("k")
-            return result, i + 1, True
-
-        # ç -> s
-        if char == "ç":
-            result.append("s")
-            return result, i + 1, True
-
-        # g: before e/i -> ʒ, otherwise ɡ
-        if char == "g":
-            if i + 1 < n and text[i + 1] in "ei":
-                result.append("ʒ")
-            else:
-                result.append("ɡ")
-            return result, i + 1, True
-
-        # j -> ʒ
-        if char == "j":
-            result.append("ʒ")
-            return result, i + 1, True
-
-        # x -> ʃ
-        if char == "x":
-            result.append("ʃ")
-            return result, i + 1, True
-
-        # z: final -> s, otherwise z
-        if char == "z":
-            if i + 1 >= n:
-                result.append("s")
-            else:
-                result.append("z")
-            return result, i + 1, True
-
-        # s: between vowels -> z, otherwise s
-        if char == "s":
-            if (
-                i > 0
-                and i + 1 < n
-                and text[i - 1] in "aeiouãõ"
-                and text[i + 1] in "aeiouãõ"
-            ):
-                result.append("z")
-            else:
-                result.append("s")
-            return result, i + 1, True
+    # Complete dispatch tables keyed by the affricate_ti_di option
+    _HANDLERS: Final[dict[bool, dict[str, Callable[..., tuple[str, int]]]]] = {
+        True: {
+            **_COMMON_HANDLERS,
+            "t": _process_t_consonant,
+            "d": _process_d_consonant,
+        },
+        False: {**_COMMON_HANDLERS, "t": _process_plain_letter},
+    }
 
-        # r: initial -> r, otherwise ɾ
-        if char == "r":
-            if i == 0:
-                result.append("r")
-            else:
-                result.append("ɾ")
-            return result, i + 1, True
+    def _word_to_phonemes(self, word: str) -> str:
+        """Convert a single word to phonemes, using the word cache.
 
-        # l: before consonant/final -> w, otherwise l
-        if char == "l":
-            if i + 1 >= n or text[i + 1] not in "aeiouãõ":
-                result.append("w")
-            else:
-                result.append("l")
-            return result, i + 1, True
-
-        # m, n -> pass through
-        if char in "mn":
-            result.append(char)
-            return result, i + 1, True
-
-        # w, y -> w, j
-        if char in "wy":
-            if char == "w":
-                result.append("w")
-            else:
-                result.append("j")
-            return result, i + 1, True
+        Args:
+            word: Word to convert.
 
-        return [], i, False
+        Returns:
+            Phoneme string in IPA.
+        """
+        key = (word, self.mark_stress, self.affricate_ti_di)
+        phonemes = self._word_cache.get(key)
+        if phonemes is None:
+            phonemes = self._convert_word(word)
+            cache_put(self._word_cache, key, phonemes, self._WORD_CACHE_SIZE)
+        return phonemes
 
-    def _word_to_phonemes(self, word: str) -> str:
-        """Convert a single word to phonemes.
+    def _convert_word(self, word: str) -> str:
+        """Convert a single word to phonemes using Portuguese rules.
 
         Args:
             word: Word to convert.
@@ -557,93 +606,67 @@ class PortugueseG2P(G2PBase):
             return ""
 
         # Check lexicon first
-        word_lower = word.lower()
-        if word_lower in self._LEXICON:
-            base_phonemes = self._LEXICON[word_lower]
+        text = word.lower()
+        base_phonemes = self._LEXICON.get(text)
+        if base_phonemes is not None:
             if not self.mark_stress:
                 base_phonemes = base_phonemes.replace("ˈ", "")
             return base_phonemes
 
-        # Convert to lowercase for processing
-        text = word.lower()
-
-        # Normalize and track stress
-        text, stressed_vowels, open_vowels = self._normalize_text(text)
+        # Normalize and track stress; ASCII words carry no accents, so they
+        # skip normalization and share one all-zero bitmap
+        if text.isascii():
+            stressed_vowels = open_vowels = bytearray(len(text))
+        else:
+            text, stressed_vowels, open_vowels = self._normalize_text(text)
 
         result: list[str] = []
+        append = result.append
         i = 0
         n = len(text)
+        # Option-specific tables keep the flag checks out of the loop
+        handlers = self._HANDLERS[self.affricate_ti_di]
+        single_letters = _SINGLE_LETTERS_BY_AFFRICATION[self.affricate_ti_di]
+        roots = _GRAPHEME_TRIE.children
 
+        # One table lookup per grapheme: the first character selects the rule
         while i < n:
-            matched = False
-
-            # Multi-character sequences first
-            phonemes, new_i, was_matched = self._process_multi_char_sequences(
-                text, i, n
-            )
-            if was_matched:
-                result.extend(phonemes)
-                i = new_i
-                matched = True
-
-            # Try nasal combinations if not yet matched
-            if not matched:
-                phonemes, new_i, was_matched = self._process_nasal_vowel(
-                    text, i, n, stressed_vowels
-                )
-                if was_matched:
-                    result.extend(phonemes)
-                    i = new_i
-                    matched = True
-
-            # Already-nasalized vowels
-            if not matched and text[i] in "ãõ":
-                result.append(text[i])
-                if self.mark_stress and i in stressed_vowels:
-                    result.append("ˈ")
+            char = text[i]
+            # Context-free letters are emitted directly without a handler call
+            phonemes = single_letters.get(char)
+            if phonemes is not None:
+                append(phonemes)
                 i += 1
-                matched = True
-
-            # t/d consonants with affrication
-            if not matched and text[i] == "t":
-                phonemes, new_i, was_matched = self._process_t_consonant(
-                    text, i, n, stressed_vowels
-                )
-                result.extend(phonemes)
-                i = new_i
-                matched = True
-
-            if not matched and text[i] == "d":
-                phonemes, new_i, was_matched = self._process_d_consonant(
-                    text, i, n, stressed_vowels
-                )
-                result.extend(phonemes)
-                i = new_i
-                matched = True
-
-            # Other consonants
-            if not matched:
-                phonemes, new_i, was_matched = self._process_simple_consonants(
-                    text, i, n, stressed_vowels
-                )
-                if was_matched:
-                    result.extend(phonemes)
-                    i = new_i
-                    matched = True
-
-            # Vowels (with possible diphthongs)
-            if not matched and text[i] in "aeiou":
-                phonemes, new_i = self._process_vowel(
-                    text, i, n, stressed_vowels, open_vowels
-                )
-                result.extend(phonemes)
-                i = new_i
-                matched = True
-
-            # Unknown character - skip
-            if not matched:
+                continue
+
+            # Longest multi-letter grapheme starting here (tch, nh, lh, ...)
+            node = roots.get(char)
+            if node is not None:
+                match = None
+                j = i + 1
+                while j < n:
+                    node = node.children.get(text[j])
+                    if node is None:
+                        break
+                    j += 1
+                    if node.phonemes is not None:
+                        match = (node.phonemes, j)
+                if match is not None:
+                    phonemes, i = match
+                    append(phonemes)
+                    continue
+
+            handler = handlers.get(char)
+            if handler is None:
+                # Unknown character - skip
                 i += 1
+                continue
+            phonemes, i = handler(self, text, i, n, stressed_vowels, open_vowels)
+            append(phonemes)
 
+        # Stress marks are always emitted and dropped here when disabled
+        if not self.mark_stress:
+            return "".join(result).replace("ˈ", "")
         return "".join(result)
 
     def lookup(self, word: str, tag: str | None = None) -> str | None:
@@ -13,8 +13,10 @@ All other punctuation is either normalized or removed.
 """
 
 import re
+import sys
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from re import Pattern
 from typing import Final
 
@@ -43,6 +45,19 @@ KOKORO_PUNCTUATION: Final[frozenset[str]] = frozenset(
     ]
 )
 
+# Anything that is not alphanumeric, whitespace or Kokoro punctuation
+# (\w also matches "_", which is not alphanumeric)
+_UNSUPPORTED_RE: Final[Pattern[str]] = re.compile(
+    r"_|[^\w\s" + re.escape("".join(sorted(KOKORO_PUNCTUATION))) + "]"
+)
+
+# Preserved chunks and marks shorter than this are interned, since short
+# fragments repeat across a corpus
+_INTERN_MAX_LEN: Final[int] = 64
+
+# Lists at least this long are handled by Punctuation.remove in one pass
+_REMOVE_BATCH_SIZE: Final[int] = 16
+
 # Default marks for preserve/restore operations
 DEFAULT_MARKS: Final[str] = ';:,.!?—…"()""'
 
@@ -129,6 +144,31 @@ REMOVE_PUNCTUATION: Final[frozenset[str]] = frozenset(
     "→←↑↓↔↕"  # arrows (except Kokoro's pitch markers)
 )
 
+# Multi-character normalizations (ellipses), applied in order before the table
+_MULTI_NORMALIZE: Final[dict[str, str]] = {
+    k: v for k, v in PUNCTUATION_NORMALIZATION.items() if len(k) > 1
+}
+
+# Single-character normalizations and removals as one translate table
+_NORMALIZE_TRANS: Final[dict[int, str | None]] = str.maketrans(
+    {
+        **dict.fromkeys(REMOVE_PUNCTUATION),
+        **{k: v for k, v in PUNCTUATION_NORMALIZATION.items() if len(k) == 1},
+    }
+)
+
+# Characters that normalize() may change. A lone "." is left alone, so dots
+# are instead checked for as runs
+_NORMALIZE_TRIGGERS: Final[str] = "".join(
+    sorted(
+        {chr(c) for c in _NORMALIZE_TRANS}
+        | {k[0] for k in _MULTI_NORMALIZE if not k.startswith(".")}
+    )
+)
+_NORMALIZE_TRIGGER_RE: Final[Pattern[str]] = re.compile(
+    "[" + re.escape(_NORMALIZE_TRIGGERS) + "]"
+)
+
 
 # =============================================================================
 # Position tracking for preserve/restore
@@ -153,6 +193,31 @@ class MarkIndex:
     position: Position  # Where in the utterance
 
 
+@lru_cache(maxsize=32)
+def _build_marks_re(marks: str, is_pattern: bool) -> Pattern[str]:
+    """Compile the regex matching runs of marks and surrounding spaces.
+
+    The outer group captures the whole run, so that re.split() returns it.
+
+    Args:
+        marks: The mark characters, or the source of a user pattern.
+        is_pattern: Whether marks is a regex source rather than characters.
+
+    Returns:
+        The compiled marks regex.
+    """
+    if is_pattern:
+        return re.compile(r"((?:(" + marks + r")|\s)+)")
+    # Zero or more spaces + one or more marks + zero or more spaces
+    return re.compile(rf"((?:\s*[{re.escape(marks)}]+\s*)+)")
+
+
+# The default marks are set by nearly every Punctuation instance, so they are
+# prepared once at import
+_DEFAULT_MARKS_STR: Final[str] = "".join(sorted(set(DEFAULT_MARKS)))
+_DEFAULT_MARKS_RE: Final[Pattern[str]] = _build_marks_re(_DEFAULT_MARKS_STR, False)
+
+
 # =============================================================================
 # Punctuation class
 # =============================================================================
@@ -221,13 +286,16 @@ class Punctuation:
         """Set the punctuation marks."""
         if isinstance(value, Pattern):
             # Wrap pattern to catch surrounding spaces
-            self._marks_re = re.compile(r"((" + value.pattern + r")|\s)+")
+            self._marks_re = _build_marks_re(value.pattern, True)
             self._marks = None
         elif isinstance(value, str):
-            self._marks = "".join(set(value))
-            # Build regex: zero or more spaces + one or more marks + zero or more spaces
-            escaped = re.escape(self._marks)
-            self._marks_re = re.compile(rf"(\s*[{escaped}]+\s*)+")
+            if value == DEFAULT_MARKS:
+                self._marks = _DEFAULT_MARKS_STR
+                self._marks_re = _DEFAULT_MARKS_RE
+            elif self._marks is None or set(value) != set(self._marks):
+                # Sorted, so that equal sets of marks share a cached regex
+                self._marks = "".join(sorted(set(value)))
+                self._marks_re = _build_marks_re(self._marks, False)
         else:
             raise ValueError("Punctuation marks must be a string or re.Pattern")
 
@@ -249,45 +317,17 @@ class Punctuation:
             >>> punct.normalize("Wait...what?!")
             'Wait…what?!'
         """
-        result = []
-        i = 0
-        while i < len(text):
-            char = text[i]
-
-            # Check for multi-character normalizations first
-            # ASCII ellipsis
-            if i + 2 < len(text) and text[i : i + 3] == "...":
-                result.append("…")
-                i += 3
-                continue
-            if i + 1 < len(text) and text[i : i + 2] == "..":
-                result.append("…")
-                i += 2
-                continue
-
-            # Fullwidth ellipsis (．．．)
-            if i + 2 < len(text) and text[i : i + 3] == "．．．":
-                result.append("…")
-                i += 3
-                continue
-
-            # Japanese middle dot ellipsis (・・・)
-            if i + 2 < len(text) and text[i : i + 3] == "・・・":
-                result.append("…")
-                i += 3
-                continue
-
-            # Single character normalization
-            if char in PUNCTUATION_NORMALIZATION:
-                result.append(PUNCTUATION_NORMALIZATION[char])
-            elif char in REMOVE_PUNCTUATION:
-                # Skip characters that should be removed
-                pass
-            else:
-                result.append(char)
-            i += 1
+        if ".." not in text and _NORMALIZE_TRIGGER_RE.search(text) is None:
+            # Nothing to normalize
+            return text
+
+        # Ellipses first, so that e.g. fullwidth periods mapped to "." by the
+        # table are not merged into a new ellipsis
+        for old, new in _MULTI_NORMALIZE.items():
+            if old in text:
+                text = text.replace(old, new)
 
-        return "".join(result)
+        return text.translate(_NORMALIZE_TRANS)
 
     def remove(self, text: str | list[str]) -> str | list[str]:
         """Remove all punctuation marks, replacing with spaces.
@@ -305,15 +345,19 @@ class Punctuation:
             >>> punct.remove(["Hello!", "How are you?"])
             ['Hello', 'How are you']
         """
-
-        def _remove_single(t: str) -> str:
-            if self._marks_re is None:
-                return t
-            return re.sub(self._marks_re, " ", t).strip()
-
+        marks_re = self._marks_re
+        if marks_re is None:
+            return text if isinstance(text, str) else list(text)
         if isinstance(text, str):
-            return _remove_single(text)
-        return [_remove_single(t) for t in text]
+            return marks_re.sub(" ", text).strip()
+
+        if len(text) >= _REMOVE_BATCH_SIZE and self._marks is not None:
+            # Substitute over the whole batch at once. String marks only match
+            # spaces and mark characters, so they never span the separator.
+            joined = "\x00".join(text)
+            if "\x00" not in self._marks and joined.count("\x00") == len(text) - 1:
+                return [t.strip() for t in marks_re.sub(" ", joined).split("\x00")]
+        return [marks_re.sub(" ", t).strip() for t in text]
 
     def preserve(self, text: str | list[str]) -> tuple[list[str], list[MarkIndex]]:
         """Extract punctuation from text, preserving positions for restoration.
@@ -355,34 +399,32 @@ class Punctuation:
         if self._marks_re is None:
             return [line], []
 
-        matches = list(re.finditer(self._marks_re, line))
-        if not matches:
+        # Alternating [text, mark, <inner groups>..., text, ...]; the outer
+        # group of the marks regex holds the whole mark
+        parts = self._marks_re.split(line)
+        if len(parts) == 1:
             return [line], []
+        stride = self._marks_re.groups + 1
+        preserved_line = [
+            sys.intern(t) if len(t) < _INTERN_MAX_LEN else t for t in parts[::stride]
+        ]
+        found = [
+            sys.intern(m) if len(m) < _INTERN_MAX_LEN else m for m in parts[1::stride]
+        ]
 
         # Line is only punctuation
-        if len(matches) == 1 and matches[0].group() == line:
+        if len(found) == 1 and not preserved_line[0] and not preserved_line[1]:
             return [], [MarkIndex(num, line, Position.ALONE)]
 
-        # Build list of mark indices
-        marks: list[MarkIndex] = []
-        for match in matches:
-            # Determine position: Begin, End, Middle, or Alone
-            position = Position.MIDDLE
-            if match == matches[0] and line.startswith(match.group()):
-                position = Position.BEGIN
-            elif match == matches[-1] and line.endswith(match.group()):
-                position = Position.END
-            marks.append(MarkIndex(num, match.group(), position))
-
-        # Split line into segments
-        preserved_line: list[str] = []
-        remaining = line
-        for mark in marks:
-            parts = remaining.split(mark.mark, 1)
-            preserved_line.append(parts[0])
-            remaining = parts[1] if len(parts) > 1 else ""
-
-        return preserved_line + [remaining], marks
+        # Build list of mark indices: a mark is at the beginning (end) when
+        # the text before (after) it is empty
+        marks = [MarkIndex(num, mark, Position.MIDDLE) for mark in found]
+        if not preserved_line[-1]:
+            marks[-1] = MarkIndex(num, found[-1], Position.END)
+        if not preserved_line[0]:
+            # Takes precedence if the first mark is also the last
+            marks[0] = MarkIndex(num, found[0], Position.BEGIN)
+        return preserved_line, marks
 
     @classmethod
     def restore(
@@ -418,43 +460,46 @@ class Punctuation:
 
         punctuated: list[str] = []
         pos = 0
-
-        while text or marks:
-            if not marks:
+        # Heads of the remaining text chunks and marks
+        ti = 0
+        mi = 0
+        num_text = len(text)
+        num_marks = len(marks)
+
+        while ti < num_text or mi < num_marks:
+            if mi == num_marks:
                 # No more marks, append remaining text
-                for line in text:
+                for line in text[ti:]:
                     if not strip and word_sep and not line.endswith(word_sep):
                         line = line + word_sep
                     punctuated.append(line)
-                text = []
+                ti = num_text
 
-            elif not text:
+            elif ti == num_text:
                 # No more text, append marks
-                mark_str = "".join(m.mark for m in marks)
-                mark_str = re.sub(r" ", word_sep, mark_str)
+                mark_str = "".join(m.mark for m in marks[mi:]).replace(" ", word_sep)
                 punctuated.append(mark_str)
-                marks = []
+                mi = num_marks
 
             else:
-                current_mark = marks[0]
+                current_mark = marks[mi]
                 if current_mark.index == pos:
                     # Place the current mark
-                    mark = marks[0]
-                    marks = marks[1:]
-                    mark_str = re.sub(r" ", word_sep, mark.mark)
+                    mi += 1
+                    mark_str = current_mark.mark.replace(" ", word_sep)
 
                     # Remove trailing word separator from current text
-                    if word_sep and text[0].endswith(word_sep):
-                        text[0] = text[0][: -len(word_sep)]
+                    if word_sep and text[ti].endswith(word_sep):
+                        text[ti] = text[ti][: -len(word_sep)]
 
                     if current_mark.position == Position.BEGIN:
-                        text[0] = mark_str + text[0]
+                        text[ti] = mark_str + text[ti]
                     elif current_mark.position == Position.END:
                         suffix = (
                             "" if strip or mark_str.endswith(word_sep) else word_sep
                         )
-                        punctuated.append(text[0] + mark_str + suffix)
-                        text = text[1:]
+                        punctuated.append(text[ti] + mark_str + suffix)
+                        ti += 1
                         pos += 1
                     elif current_mark.position == Position.ALONE:
                         suffix = (
@@ -464,15 +509,15 @@ class Punctuation:
                         pos += 1
                     else:
                         # Position.MIDDLE
-                        if len(text) == 1:
-                            text[0] = text[0] + mark_str
+                        if ti == num_text - 1:
+                            text[ti] = text[ti] + mark_str
                         else:
-                            first = text[0]
-                            text = text[1:]
-                            text[0] = first + mark_str + text[0]
+                            first = text[ti]
+                            ti += 1
+                            text[ti] = first + mark_str + text[ti]
                 else:
-                    punctuated.append(text[0])
-                    text = text[1:]
+                    punctuated.append(text[ti])
+                    ti += 1
                     pos += 1
 
         return punctuated
@@ -482,12 +527,23 @@ class Punctuation:
 # Utility functions
 # =============================================================================
 
+# Shared instance for the module-level helpers
+_default_punct: Punctuation | None = None
+
+
+def _get_default_punct() -> Punctuation:
+    """Get or create the shared default Punctuation instance."""
+    global _default_punct
+    if _default_punct is None:
+        _default_punct = Punctuation()
+    return _default_punct
+
 
 def normalize_punctuation(text: str) -> str:
     """Normalize Unicode punctuation to Kokoro-compatible equivalents.
 
-    This is a convenience function that creates a Punctuation instance
-    and calls normalize().
+    This is a convenience function that calls normalize() on a shared
+    default Punctuation instance.
 
     Args:
         text: Input text with various Unicode punctuation.
@@ -499,7 +555,7 @@ def normalize_punctuation(text: str) -> str:
         >>> normalize_punctuation("Hello… world！")
         'Hello… world!'
     """
-    return Punctuation().normalize(text)
+    return _get_default_punct().normalize(text)
 
 
 def filter_punctuation(text: str) -> str:
@@ -515,15 +571,9 @@ def filter_punctuation(text: str) -> str:
         >>> filter_punctuation("Hello~world!")
         'Hello world!'
     """
-    punct = Punctuation()
-    normalized = punct.normalize(text)
+    normalized = _get_default_punct().normalize(text)
     # Remove any remaining unsupported punctuation
-    result = []
-    for char in normalized:
-        if char.isalnum() or char.isspace() or char in KOKORO_PUNCTUATION:
-            result.append(char)
-        # Skip unsupported punctuation
-    return "".join(result)
+    return _UNSUPPORTED_RE.sub("", normalized)
 
 
 def is_kokoro_punctuation(char: str) -> bool:
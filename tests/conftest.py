@@ -35,6 +35,35 @@ def has_espeak() -> bool:
         return False
 
 
+@pytest.fixture(scope="session")
+def shared_espeak_wrapper(has_espeak):
+    """Create one EspeakWrapper for the whole test session."""
+    if not has_espeak:
+        pytest.skip("espeak not available")
+    from kokorog2p.backends.espeak import EspeakWrapper
+
+    wrapper = EspeakWrapper()
+    wrapper.set_voice("en-us")
+    return wrapper
+
+
+@pytest.fixture(scope="session")
+def espeak_voices(shared_espeak_wrapper):
+    """Get the espeak and mbrola voice lists once for the whole session."""
+    return (
+        shared_espeak_wrapper.list_voices(),
+        shared_espeak_wrapper.list_voices("mbrola"),
+    )
+
+
+@pytest.fixture
+def espeak_wrapper(shared_espeak_wrapper):
+    """Get the shared EspeakWrapper, restoring the en-us voice afterwards."""
+    yield shared_espeak_wrapper
+    if shared_espeak_wrapper.voice.language != "en-us":
+        shared_espeak_wrapper.set_voice("en-us")
+
+
 @pytest.fixture
 def espeak_backend():
     """Create an EspeakBackend instance for testing."""
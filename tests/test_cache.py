@@ -0,0 +1,55 @@
+"""Tests for the bounded cache helpers."""
+
+import pytest
+
+from kokorog2p._cache import cache_put, load_json_cache, save_json_cache
+
+
+class TestCachePut:
+    """Tests for bounded cache insertion."""
+
+    def test_evicts_oldest(self):
+        """Test that the oldest entry is dropped once the cache is full."""
+        cache: dict[str, int] = {}
+        for i, key in enumerate("abcd"):
+            cache_put(cache, key, i, max_size=3)
+        assert list(cache) == ["b", "c", "d"]
+
+
+class TestJsonCache:
+    """Tests for saving and loading caches as JSON."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a saved cache loads back unchanged."""
+        cache_file = tmp_path / "sub" / "cache.json"
+        cache = {("ciao", True, False): "ʧiao", ("città", False, True): "ʧitːa"}
+        save_json_cache(cache_file, cache)
+        assert not list(cache_file.parent.glob("*.tmp"))
+
+        loaded: dict = {}
+        load_json_cache(cache_file, loaded, key_size=3, max_size=10, name="test")
+        assert loaded == cache
+
+    def test_load_keeps_newest(self, tmp_path):
+        """Test that only the most recently saved entries are loaded."""
+        cache_file = tmp_path / "cache.json"
+        save_json_cache(cache_file, {(str(i),): i for i in range(5)})
+
+        loaded: dict = {}
+        load_json_cache(cache_file, loaded, key_size=1, max_size=2, name="test")
+        assert loaded == {("3",): 3, ("4",): 4}
+
+    @pytest.mark.parametrize(
+        "content", ["not json", "[1, 2]", '[["a", "b", "c"]]', "{}"]
+    )
+    def test_load_unreadable(self, tmp_path, content):
+        """Test that an unreadable cache file is ignored with a warning."""
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_text(content, encoding="utf-8")
+
+        loaded = {("stale",): "x"}
+        with pytest.warns(UserWarning, match="test cache"):
+            load_json_cache(
+                cache_file, loaded, key_size=1, max_size=10, name="test cache"
+            )
+        assert loaded == {}
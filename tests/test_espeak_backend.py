@@ -5,11 +5,20 @@ Licensed under the Apache License, Version 2.0
 """
 
 import os
+import pathlib
 import pickle
 import sys
 
 import pytest
 
+from kokorog2p.backends.espeak import (
+    EspeakBackend,
+    EspeakVoice,
+    EspeakWrapper,
+    Phonemizer,
+    Voice,
+)
+
 
 @pytest.mark.espeak
 class TestEspeakBackend:
@@ -58,6 +67,56 @@ class TestEspeakBackend:
         assert len(results) == 3
         assert all(isinstance(r, str) for r in results)
 
+    def test_phonemize_list_parallel(self, espeak_backend):
+        """Test batch phonemization in worker processes."""
+        texts = ["hello", "world", "test", "say", "Hello world"]
+        expected = espeak_backend.phonemize_list(texts)
+        espeak_backend.clear_cache()
+        assert espeak_backend.phonemize_list(texts, n_jobs=2) == expected
+
+    def test_phonemize_list_parallel_cache(self, espeak_backend):
+        """Test that worker processes only see cache misses and fill the cache."""
+        espeak_backend.phonemize("hello")
+        espeak_backend._cache[("world", "en-us", "^", True)] = "cached"
+
+        texts = ["hello", "world", "test", "say", "test"]
+        results = espeak_backend.phonemize_list(texts, n_jobs=2)
+        assert results[1] == "cached"
+        assert results[2] == results[4]
+        assert espeak_backend.get_cache_size() == 4
+        assert espeak_backend.phonemize("say") == results[3]
+
+    def test_phonemize_cache(self, espeak_backend):
+        """Test that repeated texts are served from the cache."""
+        first = espeak_backend.phonemize("hello")
+        assert espeak_backend.get_cache_size() == 1
+        assert espeak_backend.phonemize("hello") == first
+        assert espeak_backend.get_cache_size() == 1
+
+        # Raw IPA is cached separately from Kokoro phonemes
+        espeak_backend.phonemize("hello", convert_to_kokoro=False)
+        assert espeak_backend.get_cache_size() == 2
+
+        espeak_backend.clear_cache()
+        assert espeak_backend.get_cache_size() == 0
+        assert espeak_backend.phonemize("hello") == first
+
+    def test_persistent_cache(self, has_espeak, tmp_path):
+        """Test that the phonemize cache can be saved and reloaded."""
+        if not has_espeak:
+            pytest.skip("espeak not available")
+
+        cache_file = tmp_path / "espeak_cache.json"
+        backend = EspeakBackend("en-us", cache_path=cache_file)
+        expected = backend.phonemize("hello world")
+        backend.save_cache()
+        assert cache_file.exists()
+
+        reloaded = EspeakBackend("en-us", cache_path=cache_file)
+        assert reloaded._cache == backend._cache
+        assert reloaded.phonemize("hello world") == expected
+        assert reloaded._phonemizer is None
+
     def test_word_phonemes(self, espeak_backend):
         """Test single word phonemization without separators."""
         result = espeak_backend.word_phonemes("hello")
@@ -88,42 +147,22 @@ class TestEspeakBackend:
 class TestPhonemizer:
     """Tests for the Phonemizer (wrapper) class."""
 
-    def test_version(self, has_espeak):
+    def test_version(self, espeak_wrapper):
         """Test version is available."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
+        assert espeak_wrapper.version is not None
+        assert isinstance(espeak_wrapper.version, tuple)
+        assert len(espeak_wrapper.version) >= 2
 
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p = Phonemizer()
-        assert p.version is not None
-        assert isinstance(p.version, tuple)
-        assert len(p.version) >= 2
-
-    def test_phonemize(self, has_espeak):
+    def test_phonemize(self, espeak_wrapper):
         """Test basic phonemization."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
-
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p = Phonemizer()
-        p.set_voice("en-us")
-
-        result = p.phonemize("hello")
+        result = espeak_wrapper.phonemize("hello")
         assert isinstance(result, str)
         assert len(result) > 0
 
-    def test_set_voice(self, has_espeak):
+    def test_set_voice(self, espeak_wrapper):
         """Test voice selection."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
-
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p = Phonemizer()
-        p.set_voice("en-us")
-        p.set_voice("en-gb")
+        espeak_wrapper.set_voice("en-us")
+        espeak_wrapper.set_voice("en-gb")
 
 
 @pytest.mark.espeak
@@ -135,10 +174,9 @@ class TestVoice:
         if not has_espeak:
             pytest.skip("espeak not available")
 
-        from kokorog2p.backends.espeak import Voice
-
         voice = Voice.from_language("en-us")
         assert voice.language == "en-us"
+        assert not hasattr(voice, "__dict__")
 
         voice_gb = Voice.from_language("en-gb")
         assert voice_gb.language == "en-gb"
@@ -148,37 +186,31 @@ class TestVoice:
 class TestVoiceListing:
     """Tests for listing available voices."""
 
-    def test_list_voices(self, has_espeak):
+    def test_list_voices(self, espeak_voices):
         """Test listing all voices."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
-
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p = Phonemizer()
-        voices = p.list_voices()
+        voices, _ = espeak_voices
 
         assert voices
         assert len(voices) > 0
         languages = {v.language for v in voices}
         assert any(lang.startswith("en") for lang in languages if lang)
 
-    def test_list_voices_filtered(self, has_espeak):
+    def test_list_voices_filtered(self, espeak_voices):
         """Test listing voices with filter."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
-
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p = Phonemizer()
-        mbrola = p.list_voices("mbrola")
-        espeak = p.list_voices()
+        espeak, mbrola = espeak_voices
 
         if mbrola:
             espeak_ids = {v.identifier for v in espeak}
             mbrola_ids = {v.identifier for v in mbrola}
             assert not espeak_ids.intersection(mbrola_ids)
 
+    def test_list_voices_cached(self, espeak_wrapper):
+        """Test that voice lists are shared between instances."""
+        voices = espeak_wrapper.list_voices()
+        voices.clear()
+        assert espeak_wrapper.list_voices()
+        assert Phonemizer().list_voices() == espeak_wrapper.list_voices()
+
 
 @pytest.mark.espeak
 class TestVoiceSelection:
@@ -189,8 +221,6 @@ class TestVoiceSelection:
         if not has_espeak:
             pytest.skip("espeak not available")
 
-        from kokorog2p.backends.espeak import Phonemizer
-
         p = Phonemizer()
         assert p.voice is None
 
@@ -201,36 +231,22 @@ class TestVoiceSelection:
         p.set_voice("fr-fr")
         assert p.voice.language == "fr-fr"
 
-    def test_invalid_voice(self, has_espeak):
+    def test_invalid_voice(self, espeak_wrapper):
         """Test error on invalid voice."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
-
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p = Phonemizer()
-
         with pytest.raises(RuntimeError):
-            p.set_voice("")
+            espeak_wrapper.set_voice("")
 
         with pytest.raises(RuntimeError):
-            p.set_voice("nonexistent-xyz")
+            espeak_wrapper.set_voice("nonexistent-xyz")
 
 
 @pytest.mark.espeak
 class TestPickling:
     """Tests for pickle support."""
 
-    def test_pickle_phonemizer(self, has_espeak):
+    def test_pickle_phonemizer(self, espeak_wrapper):
         """Test pickling and unpickling."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
-
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p1 = Phonemizer()
-        p1.set_voice("en-us")
-
+        p1 = espeak_wrapper
         data = pickle.dumps(p1)
         p2 = pickle.loads(data)
 
@@ -238,15 +254,9 @@ class TestPickling:
         assert p1.library_path == p2.library_path
         assert p1.voice.language == p2.voice.language
 
-    def test_pickle_preserves_results(self, has_espeak):
+    def test_pickle_preserves_results(self, espeak_wrapper):
         """Test pickled instance produces same output."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
-
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p1 = Phonemizer()
-        p1.set_voice("en-us")
+        p1 = espeak_wrapper
         result1 = p1.phonemize("hello")
 
         data = pickle.dumps(p1)
@@ -260,27 +270,17 @@ class TestPickling:
 class TestMultipleInstances:
     """Tests for multiple phonemizer instances."""
 
-    def test_shared_properties(self, has_espeak):
+    def test_shared_properties(self, espeak_wrapper):
         """Test instances share some properties."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
-
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p1 = Phonemizer()
+        p1 = espeak_wrapper
         p2 = Phonemizer()
 
         assert p1.version == p2.version
         assert p1.library_path == p2.library_path
 
-    def test_independent_voices(self, has_espeak):
+    def test_independent_voices(self, espeak_wrapper):
         """Test instances have independent voice selection."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
-
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p1 = Phonemizer()
+        p1 = espeak_wrapper
         p2 = Phonemizer()
 
         p1.set_voice("fr-fr")
@@ -289,73 +289,68 @@ class TestMultipleInstances:
         assert p1.voice.language == "fr-fr"
         assert p2.voice.language == "en-us"
 
-
-@pytest.mark.espeak
-class TestLibraryInfo:
-    """Tests for library information."""
-
-    def test_version_tuple(self, has_espeak):
-        """Test version format."""
+    def test_shared_library(self, has_espeak):
+        """Test instances share one library but keep their own voices."""
         if not has_espeak:
             pytest.skip("espeak not available")
 
-        from kokorog2p.backends.espeak import Phonemizer
+        p1 = Phonemizer()
+        p2 = Phonemizer()
+        p1.set_voice("fr-fr")
+        p2.set_voice("en-us")
+        assert p1._api is p2._api
+
+        french = p1.phonemize("bonjour")
+        english = p2.phonemize("bonjour")
+        assert french != english
+        assert p1.phonemize("bonjour") == french
+
+    def test_lazy_library_loading(self, espeak_wrapper):
+        """Test the library is only loaded once an instance needs it."""
+        version = espeak_wrapper.version
+        voices = espeak_wrapper.list_voices()
 
         p = Phonemizer()
-        assert p.version >= (1, 48)
-        assert all(isinstance(v, int) for v in p.version)
+        assert p.version == version
+        assert p.list_voices() == voices
+        assert p._espeak is None
 
-    def test_library_path(self, has_espeak):
-        """Test library path."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
+        p.set_voice("en-us")
+        assert p._espeak is not None
 
-        from kokorog2p.backends.espeak import Phonemizer
 
-        p = Phonemizer()
-        assert "espeak" in str(p.library_path)
-        assert os.path.isabs(p.library_path)
+@pytest.mark.espeak
+class TestLibraryInfo:
+    """Tests for library information."""
 
-    def test_data_path(self, has_espeak):
-        """Test data path."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
+    def test_version_tuple(self, espeak_wrapper):
+        """Test version format."""
+        assert espeak_wrapper.version >= (1, 48)
+        assert all(isinstance(v, int) for v in espeak_wrapper.version)
 
-        from kokorog2p.backends.espeak import Phonemizer
+    def test_library_path(self, espeak_wrapper):
+        """Test library path."""
+        assert "espeak" in str(espeak_wrapper.library_path)
+        assert os.path.isabs(espeak_wrapper.library_path)
 
-        p = Phonemizer()
-        assert p.data_path is not None
+    def test_data_path(self, espeak_wrapper):
+        """Test data path."""
+        assert espeak_wrapper.data_path is not None
 
 
 @pytest.mark.espeak
 class TestTieCharacter:
     """Tests for tie character handling."""
 
-    def test_with_separator(self, has_espeak):
+    def test_with_separator(self, espeak_wrapper):
         """Test output with separator."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
-
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p = Phonemizer()
-        p.set_voice("en-us")
-
-        result = p.phonemize("Jackie", use_tie=False)
+        result = espeak_wrapper.phonemize("Jackie", use_tie=False)
         assert "_" in result
 
-    def test_with_tie(self, has_espeak):
+    def test_with_tie(self, espeak_wrapper):
         """Test output with tie character."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
-
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p = Phonemizer()
-        p.set_voice("en-us")
-
-        if p.version >= (1, 49):
-            result = p.phonemize("Jackie", use_tie=True)
+        if espeak_wrapper.version >= (1, 49):
+            result = espeak_wrapper.phonemize("Jackie", use_tie=True)
             assert "͡" in result or "_" not in result
 
 
@@ -364,19 +359,9 @@ class TestTieCharacter:
 class TestTempDirectory:
     """Tests for temporary directory handling."""
 
-    def test_temp_dir_exists(self, has_espeak):
+    def test_temp_dir_exists(self, espeak_wrapper):
         """Test temp directory exists during use."""
-        if not has_espeak:
-            pytest.skip("espeak not available")
-
-        import pathlib
-
-        from kokorog2p.backends.espeak import Phonemizer
-
-        p = Phonemizer()
-        p.set_voice("en-us")
-
-        temp_dir = pathlib.Path(p._api.temp_dir)
+        temp_dir = pathlib.Path(espeak_wrapper._api.temp_dir)
         assert temp_dir.exists()
         files = list(temp_dir.iterdir())
         assert len(files) >= 1
@@ -392,8 +377,6 @@ class TestBackwardsCompatibility:
         if not has_espeak:
             pytest.skip("espeak not available")
 
-        from kokorog2p.backends.espeak import EspeakWrapper
-
         w = EspeakWrapper()
         assert w.version is not None
 
@@ -402,7 +385,5 @@ class TestBackwardsCompatibility:
         if not has_espeak:
             pytest.skip("espeak not available")
 
-        from kokorog2p.backends.espeak import EspeakVoice
-
         v = EspeakVoice.from_language("en-us")
         assert v.language == "en-us"
@@ -149,6 +149,56 @@ class TestItalianG2P:
                 result == expected
             ), f"Expected '{expected}' but got '{result}' for '{word}'"
 
+    def test_right_context(self, g2p):
+        """Test graphemes whose reading depends on the following letters."""
+        test_cases = [
+            ("gli", "ʎi"),
+            ("aglio", "aʎo"),
+            ("glicine", "ɡliʧine"),
+            ("gioca", "ʤoka"),
+            ("giornale", "ʤiornale"),
+            ("formaggio", "formaʤːo"),
+            ("occhi", "okːi"),
+            ("agghiacciare", "aɡːiaʧːiare"),
+            ("uomo", "womo"),
+        ]
+
+        for word, expected in test_cases:
+            result = g2p.phonemize(word)
+            assert (
+                result == expected
+            ), f"Expected '{expected}' but got '{result}' for '{word}'"
+
+    def test_without_gemination(self):
+        """Test that gemination marks can be disabled."""
+        g2p = ItalianG2P(mark_gemination=False)
+        for word in ["mamma", "pizza", "cappuccino", "oggi", "bagno"]:
+            assert "ː" not in g2p.phonemize(word)
+        assert g2p.phonemize("formaggio") == "formaʤo"
+
+    def test_word_cache(self, g2p):
+        """Test that repeated words are served from the word cache."""
+        assert g2p.phonemize("ciao ciao") == "ʧiao ʧiao"
+        assert len(g2p._word_cache) == 1
+
+        # Changing an option must not return stale cached phonemes
+        g2p.mark_gemination = False
+        assert g2p.phonemize("mamma") == "mamma"
+        g2p.mark_gemination = True
+        assert g2p.phonemize("mamma") == "mamːa"
+
+    def test_persistent_cache(self, tmp_path):
+        """Test that the word cache can be saved and reloaded."""
+        cache_file = tmp_path / "it_cache.json"
+        g2p = ItalianG2P(cache_path=cache_file)
+        assert g2p.phonemize("ciao mamma") == "ʧiao mamːa"
+        g2p.save_cache()
+        assert cache_file.exists()
+
+        reloaded = ItalianG2P(cache_path=cache_file)
+        assert reloaded._word_cache == g2p._word_cache
+        assert reloaded.phonemize("ciao mamma") == "ʧiao mamːa"
+
     def test_punctuation(self, g2p):
         """Test punctuation handling."""
         text = "Ciao, come stai?"
@@ -197,6 +247,15 @@ class TestItalianG2P:
                         phoneme in IT_VOCAB
                     ), f"Phoneme '{phoneme}' from '{word}' not in IT_VOCAB"
 
+    def test_phonemize_matches_tokens(self, g2p):
+        """Test that phonemize agrees with the phonemes of __call__."""
+        text = "«Ciao», disse l'uomo — 50% di più… _ ok?"
+        expected = "".join(
+            t.phonemes + t.whitespace for t in g2p(text) if t.phonemes
+        ).rstrip()
+        assert g2p.phonemize(text) == expected
+        assert g2p.phonemize("   ") == ""
+
     def test_empty_input(self, g2p):
         """Test empty input."""
         assert g2p("") == []
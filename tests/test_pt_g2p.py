@@ -118,6 +118,20 @@ class TestPortugueseG2P:
         assert "ã" in g2p.phonemize("campo")  # am before p -> ãm
         assert "ẽ" in g2p.phonemize("tempo")  # em before p -> ẽm
 
+    def test_word_cache_stress(self, g2p):
+        """Test that cached stressed words are not reused without stress marks."""
+        # Rule-based "café" and the lexicon entry "é" both carry stress;
+        # capitalized words share the lowercase cache entry
+        assert g2p.phonemize("Café é café") == "kafɛˈ ɛˈ kafɛˈ"
+        assert len(g2p._word_cache) == 2
+
+        g2p.mark_stress = False
+        assert g2p.phonemize("café é") == "kafɛ ɛ"
+        assert len(g2p._word_cache) == 4
+
+        g2p.mark_stress = True
+        assert g2p.phonemize("café é") == "kafɛˈ ɛˈ"
+
     def test_punctuation(self, g2p):
         """Test punctuation handling."""
         result = g2p.phonemize("Olá, tudo bem?")
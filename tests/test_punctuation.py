@@ -123,6 +123,18 @@ class TestPunctuationNormalization:
         """Japanese middle dots should become ellipsis."""
         assert punct.normalize("Hello・・・world") == "Hello…world"
 
+    def test_normalize_long_dot_runs(self, punct):
+        """Longer dot runs are split greedily into ellipses from the left."""
+        assert punct.normalize("Hello....world") == "Hello….world"
+        assert punct.normalize("Hello.....world") == "Hello……world"
+        assert punct.normalize("Hello．．world") == "Hello..world"
+
+    def test_normalize_clean_text_unchanged(self, punct):
+        """Text without anything to normalize is returned as is."""
+        text = "Hello, world. How are you?"
+        assert punct.normalize(text) is text
+        assert punct.normalize("Hello・・world") == "Hello・・world"
+
     # Quotes
     def test_normalize_single_quotes_to_double(self, punct):
         """Single quotes should become double quotes."""
@@ -262,6 +274,13 @@ class TestPunctuationRemoval:
         texts = ["Hello!", "World?"]
         assert punct.remove(texts) == ["Hello", "World"]
 
+    def test_remove_long_list_input(self, punct):
+        """Long lists give the same result as removing item by item."""
+        texts = ["Hello!", "", " ...World, again? ", "no marks"] * 5
+        assert punct.remove(texts) == [punct.remove(t) for t in texts]
+        texts[3] = "null\x00byte, here"
+        assert punct.remove(texts) == [punct.remove(t) for t in texts]
+
     def test_remove_empty_string(self, punct):
         """Handle empty string."""
         assert punct.remove("") == ""
@@ -561,6 +580,14 @@ class TestCustomMarks:
         text, marks = punct.preserve("Hello! World?")
         assert len(marks) >= 2
 
+    def test_custom_marks_regex_round_trip(self):
+        """A regex mark followed by more text is not at the end."""
+        punct = Punctuation(marks=re.compile(r"\.\.\.|[,;]"))
+        text, marks = punct.preserve("Wait.....")
+        assert text == ["Wait", ".."]
+        assert marks[0].position == Position.MIDDLE
+        assert Punctuation.restore(text, marks) == ["Wait....."]
+
     def test_default_marks(self):
         """Default marks should match Kokoro vocab."""
         punct = Punctuation()
@@ -568,6 +595,16 @@ class TestCustomMarks:
         for char in default:
             assert char in KOKORO_PUNCTUATION or char == "-"
 
+    def test_set_same_marks_keeps_regex(self):
+        """Setting the same marks again should not rebuild the regex."""
+        punct = Punctuation(marks=".,!")
+        marks_re = punct._marks_re
+        punct.marks = "!.,"
+        assert punct._marks_re is marks_re
+        punct.marks = ".,"
+        assert punct._marks_re is not marks_re
+        assert punct.remove("Hello, world!") == "Hello world!"
+
 
 # =============================================================================
 # Test Position enum